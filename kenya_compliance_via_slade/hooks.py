@@ -116,6 +116,7 @@ fixtures = [
 # include js, css files in header of desk.html
 # app_include_css = "/assets/kenya_compliance_via_slade/css/kenya_compliance_via_slade.css"
 # app_include_js = "/assets/kenya_compliance_via_slade/js/kenya_compliance_via_slade.js"
+app_include_js = "/assets/kenya_compliance_via_slade/js/etims_sync.js"
 
 # include js, css files in header of web template
 # web_include_css = "/assets/kenya_compliance_via_slade/css/kenya_compliance_via_slade.css"
@@ -293,6 +294,11 @@ doc_events = {
         ],
         "on_trash": "kenya_compliance_via_slade.kenya_compliance_via_slade.overrides.server.item.prevent_item_deletion",
     },
+    "UOM": {
+        "on_update": [
+            "kenya_compliance_via_slade.kenya_compliance_via_slade.overrides.server.uom.on_update"
+        ],
+    },
 }
 
 # Scheduled Tasks
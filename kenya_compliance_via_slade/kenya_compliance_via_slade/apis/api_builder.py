@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from typing import Callable, Literal, Optional, Union
+from http.cookiejar import DefaultCookiePolicy
+from typing import Callable, Iterator, Literal, Optional, Union
 from urllib import parse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import frappe
 from frappe.integrations.utils import create_request_log
 from frappe.model.document import Document
 
 from ..logger import etims_logger
-from ..utils import update_navari_settings_with_token
+from ..utils import (
+    discard_pending_updates,
+    loads_json,
+    update_navari_settings_with_token,
+)
 
 
 class BaseEndpointsBuilder:
@@ -84,6 +91,7 @@ class EndpointsBuilder(BaseEndpointsBuilder):
         self._method: Literal["GET", "POST", "PATCH", "PUT"] | None = None
         self._success_callback_handler: Callable | None = None
         self._error_callback_handler: Callable | None = None
+        self.request_failed = False
 
         self.attach(ErrorObserver())
 
@@ -201,14 +209,16 @@ class EndpointsBuilder(BaseEndpointsBuilder):
                 reference_doctype=doctype,
             )
 
+        session = get_http_session()
+
         try:
             if self._method == "POST":
-                response = requests.post(
+                response = session.post(
                     self._url, json=self._payload, headers=self._headers
                 )
             elif self._method == "GET":
                 # self._payload["page_size"] = 15000
-                response = requests.get(
+                response = session.get(
                     self._url, headers=self._headers, params=self._payload
                 )
 
@@ -216,23 +226,30 @@ class EndpointsBuilder(BaseEndpointsBuilder):
                 patch_id = self._payload.pop("id", None)
                 if patch_id and f"/{patch_id}/" not in self._url:
                     self._url = f"{self._url.rstrip('/')}/{patch_id}/"
-                response = requests.patch(
+                response = session.patch(
                     self._url, json=self._payload, headers=self._headers
                 )
             elif self._method == "PUT":
                 put_id = self._payload.pop("id", None)
                 if put_id and f"/{put_id}/" not in self._url:
                     self._url = f"{self._url.rstrip('/')}/{put_id}/"
-                response = requests.put(
+                response = session.put(
                     self._url, json=self._payload, headers=self._headers
                 )
 
             response_data = get_response_data(response)
 
             if response.status_code in {200, 201}:
-                self._success_callback_handler(
-                    response=response_data, document_name=document_name, doctype=doctype
-                )
+                try:
+                    self._success_callback_handler(
+                        response=response_data,
+                        document_name=document_name,
+                        doctype=doctype,
+                    )
+                finally:
+                    # Handlers flush their queued updates before returning, so any
+                    # left over belong to a handler that failed partway
+                    discard_pending_updates()
 
                 current_page = response_data.get("current_page", None)
                 total_pages = response_data.get("total_pages", 0)
@@ -259,6 +276,7 @@ class EndpointsBuilder(BaseEndpointsBuilder):
                 else:
                     error = str(response_data)
 
+                self.request_failed = True
                 update_integration_request(
                     self.integration_request.name,
                     status="Failed",
@@ -278,12 +296,68 @@ class EndpointsBuilder(BaseEndpointsBuilder):
             self.notify()
             return None
 
+    def iter_pages(
+        self,
+        doctype: Document | str | None = None,
+        document_name: str | None = None,
+    ) -> Iterator[dict | str | bytes | None]:
+        """Makes the remote call and follows the response's "next" link.
+
+        Each page is handed to the success callback as it arrives and yielded
+        before the next one is fetched, so only one page is held at a time.
+        """
+        while self._url:
+            response = self.make_remote_call(
+                doctype=doctype, document_name=document_name
+            )
+            yield response
+
+            if isinstance(response, dict) and response.get("next"):
+                self._url = response["next"]
+            else:
+                break
+
+
+def build_http_session() -> requests.Session:
+    """Builds a session with pooled keep-alive connections to the Slade360 servers.
+
+    Only idempotent requests are retried on a gateway error, so a slow response to
+    a submission is never sent twice."""
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # The session outlives a single request and is shared by every site served by
+    # the process, so no cookies are kept between calls
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    return session
+
+
+SESSION = build_http_session()
+
+
+def get_http_session() -> requests.Session:
+    """The HTTP session shared by all remote calls made by this process.
+
+    Reusing one session keeps connections to the Slade360 servers alive across
+    calls, e.g. when walking a paginated search or across background jobs."""
+    return SESSION
+
 
 def get_response_data(response: requests.Response) -> Optional[Union[dict, str, bytes]]:
     content_type = response.headers.get("Content-Type", "").lower()
 
     if "application/json" in content_type:
-        return response.json()
+        return loads_json(response.content)
     elif "text/plain" in content_type or "text/html" in content_type:
         return response.text if response.text.strip() else None
     elif "application/xml" in content_type or "text/xml" in content_type:
@@ -1,6 +1,7 @@
 import asyncio
 import json
 from functools import partial
+from hashlib import sha256
 from secrets import token_hex
 from typing import Callable
 
@@ -9,7 +10,10 @@ import aiohttp
 import frappe
 import frappe.defaults
 from frappe import _
+from frappe.model import table_fields
 from frappe.model.document import Document
+from frappe.utils import getdate
+from frappe.utils.background_jobs import get_job
 
 from ..doctype.doctype_names_mapping import (
     COUNTRIES_DOCTYPE_NAME,
@@ -23,13 +27,25 @@ from ..doctype.doctype_names_mapping import (
     UOM_CATEGORY_DOCTYPE_NAME,
     USER_DOCTYPE_NAME,
 )
+from ..overrides.server.uom import ALL_UOMS_SYNCED_CACHE_KEY
 from ..utils import (
+    REQUEST_COMPLETED_SUFFIX,
     build_headers,
+    format_phone_number,
+    get_default_branch,
+    get_default_company,
+    get_document_values,
+    get_documents_values,
     get_link_value,
+    get_link_value_map,
+    get_master_slade_id,
     get_route_path,
     get_server_url,
+    load_code_maps,
     make_get_request,
     process_dynamic_url,
+    resolve_code_slade_ids,
+    resolve_slade_ids,
     split_user_email,
 )
 from .api_builder import EndpointsBuilder
@@ -68,6 +84,63 @@ from ..background_tasks.task_response_handlers import (
 )
 from .remote_response_status_handlers import on_slade_error
 
+# Seconds an identical GET request is considered in flight, should the worker
+# running it die before releasing it
+INFLIGHT_REQUEST_TTL = 600
+
+# Warehouse fields read when sending a warehouse or location to eTims
+WAREHOUSE_FIELDS = (
+    "name",
+    "custom_slade_id",
+    "is_group",
+    "warehouse_name",
+    "company",
+    "disabled",
+    "branch",
+    "parent_warehouse",
+)
+
+# Price List fields read when sending a price list to eTims
+PRICELIST_FIELDS = (
+    "name",
+    "custom_slade_id",
+    "selling",
+    "buying",
+    "price_list_name",
+    "custom_pricelist_status",
+    "custom_company",
+    "enabled",
+    "custom_warehouse",
+    "custom_effective_from",
+    "custom_effective_to",
+)
+
+# Prefixes the ids of jobs queued by enqueue_sync_request, so poll_sync_status
+# can't be used to read other jobs
+SYNC_JOB_PREFIX = "slade_sync_"
+
+# Item fields read when registering an item with eTims
+ITEM_REGISTRATION_FIELDS = (
+    "name",
+    "item_name",
+    "item_code",
+    "description",
+    "is_sales_item",
+    "is_purchase_item",
+    "custom_item_code_etims",
+    "custom_item_classification",
+    "custom_taxation_type",
+    "custom_product_type",
+    "custom_item_type",
+    "custom_etims_country_of_origin_code",
+    "custom_packaging_unit",
+    "custom_unit_of_quantity",
+    "valuation_rate",
+    "last_purchase_rate",
+    "custom_sent_to_slade",
+    "custom_slade_id",
+)
+
 
 def process_request(
     request_data: str | dict,
@@ -82,70 +155,148 @@ def process_request(
     elif isinstance(request_data, (dict, list)):
         data = request_data
 
-    if isinstance(data, list) and data:
-        first_entry = data[0]
-        company_name = (
-            first_entry.get("company_name", None)
-            or frappe.defaults.get_user_default("Company")
-            or frappe.get_value("Company", {}, "name")
-        )
-        branch_id = (
-            first_entry.get("branch_id", None)
-            or frappe.defaults.get_user_default("Branch")
-            or frappe.get_value("Branch", "name")
-        )
-        document_name = first_entry.get("document_name", None)
-    else:
-        company_name = (
-            data.get("company_name", None)
-            or frappe.defaults.get_user_default("Company")
-            or frappe.get_value("Company", {}, "name")
-        )
-        branch_id = (
-            data.get("branch_id", None)
-            or frappe.defaults.get_user_default("Branch")
-            or frappe.get_value("Branch", "name")
-        )
-        document_name = data.get("document_name", None)
+    missing_configuration = (
+        f"Failed to process {route_key}. Missing required configuration."
+    )
+
+    route = get_route_path(route_key, "VSCU Slade 360")
+    if not route or not route[0]:
+        return missing_configuration
+
+    first_entry = data[0] if isinstance(data, list) and data else data
+    company_name = first_entry.get("company_name", None) or get_default_company()
+    branch_id = first_entry.get("branch_id", None) or get_default_branch()
+    document_name = first_entry.get("document_name", None)
 
-    headers = build_headers(company_name, branch_id)
     server_url = get_server_url(company_name, branch_id)
-    route_path, _ = get_route_path(route_key, "VSCU Slade 360")
+    if not server_url:
+        return missing_configuration
 
-    route_path = process_dynamic_url(route_path, request_data)
+    # Built last as it may have to refresh the access token
+    headers = build_headers(company_name, branch_id)
+    if not headers:
+        return missing_configuration
+
+    route_path = process_dynamic_url(route[0], data)
+
+    if request_method == "GET" and isinstance(data, dict):
+        # Copied rather than popped from, as the caller may pass the same parsed
+        # request data on to further calls
+        data = {
+            key: value
+            for key, value in data.items()
+            if not (key in ("document_name", "company_name") and value)
+        }
 
+    # An identical search already running elsewhere would only fetch and apply
+    # the same pages again
+    inflight_key = None
     if request_method == "GET":
-        if "document_name" in data and data["document_name"]:
-            data.pop("document_name")
+        request_hash = sha256(
+            frappe.as_json([company_name, branch_id, route_path, data]).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        inflight_key = frappe.cache().make_key(
+            f"slade_inflight:{route_key}:{request_hash}"
+        )
+        if not frappe.cache().set(inflight_key, 1, ex=INFLIGHT_REQUEST_TTL, nx=True):
+            return f"{route_key} is already in progress."
+
+    # A builder per call so concurrent requests don't share its state
+    builder = EndpointsBuilder()
+    builder.headers = headers
+    builder.payload = data
+    builder.request_description = route_key
+    builder.method = request_method
+    builder.success_callback = handler_function
+    builder.error_callback = on_slade_error
+    builder.url = f"{server_url}{route_path}"
+
+    try:
+        # Pages are handled by the success callback as they arrive
+        for _page in builder.iter_pages(doctype=doctype, document_name=document_name):
+            pass
+    finally:
+        if inflight_key:
+            frappe.cache().delete(inflight_key)
+
+    if builder.request_failed:
+        return f"{route_key} failed. Please check the Error Log for details."
+
+    return f"{route_key} {REQUEST_COMPLETED_SUFFIX}"
+
+
+def enqueue_sync_request(
+    request_data: str | dict,
+    route_key: str,
+    handler_function: Callable,
+    doctype: str = SETTINGS_DOCTYPE_NAME,
+) -> str:
+    """Runs process_request in a background job so the web worker isn't held for
+    the remote roundtrip.
 
-        if "company_name" in data and data["company_name"]:
-            data.pop("company_name")
+    Args:
+        request_data: The request data passed on to process_request
+        route_key: The route key to call
+        handler_function: The success callback
+        doctype: The doctype the response is applied to
 
-    if headers and server_url and route_path:
-        url = f"{server_url}{route_path}"
+    Returns:
+        The job id, which the client can pass to poll_sync_status
+    """
+    payload = (
+        request_data if isinstance(request_data, str) else frappe.as_json(request_data)
+    )
+    request_hash = sha256(payload.encode(), usedforsecurity=False).hexdigest()[:16]
+    job_id = f"{SYNC_JOB_PREFIX}{route_key}_{request_hash}"
+
+    # A repeat click while the same sync is still queued is not queued again
+    frappe.enqueue(
+        process_request,
+        queue="short",
+        job_name=job_id,
+        job_id=job_id,
+        deduplicate=True,
+        request_data=request_data,
+        route_key=route_key,
+        handler_function=handler_function,
+        doctype=doctype,
+    )
 
-        while url:
-            endpoints_builder.headers = headers
-            endpoints_builder.url = url
-            endpoints_builder.payload = data
-            endpoints_builder.request_description = route_key
-            endpoints_builder.method = request_method
-            endpoints_builder.success_callback = handler_function
-            endpoints_builder.error_callback = on_slade_error
-
-            response = endpoints_builder.make_remote_call(
-                doctype=doctype,
-                document_name=document_name,
-            )
+    return job_id
 
-            if isinstance(response, dict) and "next" in response:
-                url = response["next"]
-            else:
-                url = None
 
-        return f"{route_key} completed successfully."
-    else:
-        return f"Failed to process {route_key}. Missing required configuration."
+@frappe.whitelist()
+def poll_sync_status(job_id: str) -> dict:
+    """Reports the state of a job queued by enqueue_sync_request.
+
+    Only sync jobs can be polled, and only by users who can read the doctype the
+    sync writes to.
+
+    Args:
+        job_id: The job id returned when the sync was queued
+
+    Returns:
+        The job's status and, once finished, the message process_request returned
+    """
+    if not job_id.startswith(SYNC_JOB_PREFIX):
+        frappe.throw(_("Not a sync job"), frappe.PermissionError)
+
+    job = get_job(job_id)
+    if not job:
+        # Finished jobs are dropped from the queue once their result expires
+        return {"status": "not_found", "message": None}
+
+    job_kwargs = (job.kwargs or {}).get("kwargs") or {}
+    frappe.has_permission(
+        job_kwargs.get("doctype", SETTINGS_DOCTYPE_NAME), "read", throw=True
+    )
+
+    status = job.get_status()
+    return {
+        "status": status,
+        "message": job.result if status == "finished" else None,
+    }
 
 
 @frappe.whitelist()
@@ -153,29 +304,48 @@ def bulk_submit_sales_invoices(docs_list: str) -> None:
     from ..overrides.server.sales_invoice import on_submit
 
     data = json.loads(docs_list)
-    all_sales_invoices = frappe.db.get_all(
-        "Sales Invoice", {"docstatus": 1, "custom_successfully_submitted": 0}, ["name"]
+    unsubmitted_invoices = set(
+        frappe.db.get_all(
+            "Sales Invoice",
+            {
+                "name": ["in", data],
+                "docstatus": 1,
+                "custom_successfully_submitted": 0,
+            },
+            pluck="name",
+        )
     )
 
     for record in data:
-        for invoice in all_sales_invoices:
-            if record == invoice.name:
-                doc = frappe.get_doc("Sales Invoice", record, for_update=False)
-                on_submit(doc, method=None)
+        if record in unsubmitted_invoices:
+            doc = frappe.get_doc("Sales Invoice", record, for_update=False)
+            on_submit(doc, method=None)
 
 
 @frappe.whitelist()
 def bulk_register_item(docs_list: str) -> None:
     data = json.loads(docs_list)
+    unregistered_items = set(
+        frappe.get_all(
+            "Item",
+            filters={"name": ["in", data], "custom_item_registered": 0},
+            pluck="name",
+        )
+    )
+
+    if unregistered_items:
+        load_code_maps(
+            (
+                TAXATION_TYPE_DOCTYPE_NAME,
+                ITEM_CLASSIFICATIONS_DOCTYPE_NAME,
+                PACKAGING_UNIT_DOCTYPE_NAME,
+                UNIT_OF_QUANTITY_DOCTYPE_NAME,
+            )
+        )
 
     for record in data:
-        is_registered = frappe.db.get_value("Item", record, "custom_item_registered")
-        if is_registered == 0:
-            item_name = frappe.db.get_value("Item", record, "name")
-            perform_item_registration(item_name=str(item_name))
-            print(f"Registered item: {record}")
-        else:
-            print(f"Item {record} is already registered.")
+        if record in unregistered_items:
+            perform_item_registration(item_name=record)
 
 
 @frappe.whitelist()
@@ -196,12 +366,25 @@ def perform_customer_search(request_data: str) -> None:
 
 @frappe.whitelist()
 def perform_item_registration(item_name: str) -> dict | None:
-    item = frappe.get_doc("Item", item_name)
-    missing_fields = []
+    required_fields = [
+        field
+        for field in frappe.get_meta("Item").fields
+        if field.reqd and field.fieldtype not in table_fields
+    ]
+    item = frappe.db.get_value(
+        "Item",
+        item_name,
+        list({*ITEM_REGISTRATION_FIELDS, *(f.fieldname for f in required_fields)}),
+        as_dict=True,
+    )
+    if not item:
+        frappe.throw(
+            _("Item {0} not found").format(item_name), frappe.DoesNotExistError
+        )
 
-    for field in item.meta.fields:
-        if field.reqd and not item.get(field.fieldname):
-            missing_fields.append(field.label)
+    missing_fields = [
+        field.label for field in required_fields if not item.get(field.fieldname)
+    ]
 
     if missing_fields:
         frappe.throw(
@@ -210,9 +393,29 @@ def perform_item_registration(item_name: str) -> dict | None:
             )
         )
 
-    tax = get_link_value(
-        TAXATION_TYPE_DOCTYPE_NAME, "cd", item.get("custom_taxation_type"), "slade_id"
+    # The item's code links are resolved together in one query
+    tax_record = (TAXATION_TYPE_DOCTYPE_NAME, item.get("custom_taxation_type"))
+    classification_record = (
+        ITEM_CLASSIFICATIONS_DOCTYPE_NAME,
+        item.get("custom_item_classification"),
+    )
+    packaging_unit_record = (
+        PACKAGING_UNIT_DOCTYPE_NAME,
+        item.get("custom_packaging_unit"),
     )
+    quantity_unit_record = (
+        UNIT_OF_QUANTITY_DOCTYPE_NAME,
+        item.get("custom_unit_of_quantity"),
+    )
+    slade_ids = resolve_code_slade_ids(
+        (
+            tax_record,
+            classification_record,
+            packaging_unit_record,
+            quantity_unit_record,
+        )
+    )
+    tax = slade_ids[tax_record]
     sent_to_slade = item.get("custom_sent_to_slade", False)
     custom_slade_id = item.get("custom_slade_id", None)
 
@@ -220,36 +423,21 @@ def perform_item_registration(item_name: str) -> dict | None:
         "name": item.get("item_name"),
         "document_name": item.get("name"),
         "description": item.get("description"),
-        "can_be_sold": True if item.get("is_sales_item") == 1 else False,
-        "can_be_purchased": True if item.get("is_purchase_item") == 1 else False,
-        "company_name": frappe.defaults.get_user_default("Company"),
+        "can_be_sold": bool(item.get("is_sales_item")),
+        "can_be_purchased": bool(item.get("is_purchase_item")),
+        "company_name": get_default_company(),
         "code": item.get("item_code"),
         "scu_item_code": item.get("custom_item_code_etims"),
-        "scu_item_classification": get_link_value(
-            ITEM_CLASSIFICATIONS_DOCTYPE_NAME,
-            "itemclscd",
-            item.get("custom_item_classification"),
-            "slade_id",
-        ),
+        "scu_item_classification": slade_ids[classification_record],
         "product_type": item.get("custom_product_type"),
         "item_type": item.get("custom_item_type"),
         "preferred_name": item.get("item_name"),
         "country_of_origin": item.get("custom_etims_country_of_origin_code"),
-        "packaging_unit": get_link_value(
-            PACKAGING_UNIT_DOCTYPE_NAME,
-            "code",
-            item.get("custom_packaging_unit"),
-            "slade_id",
-        ),
-        "quantity_unit": get_link_value(
-            UNIT_OF_QUANTITY_DOCTYPE_NAME,
-            "code",
-            item.get("custom_unit_of_quantity"),
-            "slade_id",
-        ),
+        "packaging_unit": slade_ids[packaging_unit_record],
+        "quantity_unit": slade_ids[quantity_unit_record],
         "sale_taxes": [tax],
-        "selling_price": round(item.get("valuation_rate", 0), 2),
-        "purchasing_price": round(item.get("last_purchase_rate", 0), 2),
+        "selling_price": round(item.get("valuation_rate") or 0, 2),
+        "purchasing_price": round(item.get("last_purchase_rate") or 0, 2),
         "categories": [],
         "purchase_taxes": [],
     }
@@ -322,10 +510,7 @@ def send_insurance_details(request_data: str) -> None:
 @frappe.whitelist()
 def send_branch_customer_details(request_data: str) -> None:
     data = json.loads(request_data)
-    phone_number = data.get("phone_number", "").replace(" ", "").strip()
-    data["phone_number"] = (
-        "+254" + phone_number[-9:] if len(phone_number) >= 9 else None
-    )
+    data["phone_number"] = format_phone_number(data.get("phone_number"))
 
     currency_name = data.get("currency")
     if "doctype" in data:
@@ -339,7 +524,7 @@ def send_branch_customer_details(request_data: str) -> None:
         )
 
     return process_request(
-        json.dumps(data),
+        data,
         "BhfCustSaveReq",
         customer_branch_details_submission_on_success,
         request_method="POST",
@@ -443,13 +628,18 @@ def perform_import_item_search_all_branches() -> None:
         ["name", "bhfid", "company"],
     )
 
+    # Search each branch in its own job so the branches are fetched in parallel
     for credential in all_credentials:
-        request_data = json.dumps(
-            {"company_name": credential.company, "branch_code": credential.bhfid}
+        frappe.enqueue(
+            perform_import_item_search,
+            queue="long",
+            job_name=f"{credential.name}_import_item_search",
+            request_data={
+                "company_name": credential.company,
+                "branch_code": credential.bhfid,
+            },
         )
 
-        perform_import_item_search(request_data)
-
 
 @frappe.whitelist()
 def perform_purchases_search(request_data: str) -> None:
@@ -507,8 +697,13 @@ def submit_inventory(name: str) -> None:
                     "custom_slade_id",
                 ),
             }
-            process_request(
-                request_data,
+            # Each warehouse is submitted in its own job so the requests run in
+            # parallel instead of waiting on one another
+            frappe.enqueue(
+                process_request,
+                queue="long",
+                job_name=f"{stock.get('name')}_submit_inventory",
+                request_data=request_data,
                 route_key="StockMasterSaveReq",
                 handler_function=submit_inventory_on_success,
                 request_method="POST",
@@ -572,7 +767,10 @@ def perform_stock_movement_search(request_data: str) -> None:
             is_async=True,
             queue="default",
             timeout=300,
-            job_name=token_hex(100),
+            job_name=f"stock_mvt_{company_name}_{token_hex(8)}",
+            # Skip polling again while a search for this company is still pending
+            job_id=f"{company_name}_stock_movement_search",
+            deduplicate=True,
         )
 
 
@@ -589,8 +787,6 @@ def submit_item_composition(request_data: str) -> None:
     if headers and server_url and route_path:
         url = f"{server_url}{route_path}"
 
-        all_items = frappe.db.get_all("Item", ["*"])
-
         # Check if item to manufacture is registered before proceeding
         manufactured_item = frappe.get_value(
             "Item",
@@ -605,44 +801,62 @@ def submit_item_composition(request_data: str) -> None:
                 title="Integration Error",
             )
 
+        items_by_code = {
+            item.item_code: item
+            for item in frappe.get_all(
+                "Item",
+                filters={
+                    "item_code": ["in", [item["item_code"] for item in data["items"]]]
+                },
+                fields=[
+                    "name",
+                    "item_code",
+                    "custom_item_registered",
+                    "custom_item_code_etims",
+                ],
+            )
+        }
+
         for item in data["items"]:
-            for fetched_item in all_items:
-                if item["item_code"] == fetched_item.item_code:
-                    if fetched_item.custom_item_registered == 1:
-                        payload = {
-                            "itemCd": data["item_code"],
-                            "cpstItemCd": fetched_item.custom_item_code_etims,
-                            "cpstQty": item["qty"],
-                            "regrId": split_user_email(data["registration_id"]),
-                            "regrNm": data["registration_id"],
-                        }
-
-                        endpoints_builder.headers = headers
-                        endpoints_builder.url = url
-                        endpoints_builder.payload = payload
-                        endpoints_builder.success_callback = partial(
-                            item_composition_submission_on_success,
-                            document_name=data["name"],
-                        )
-                        endpoints_builder.error_callback = on_error
-
-                        frappe.enqueue(
-                            endpoints_builder.make_remote_call,
-                            is_async=True,
-                            queue="default",
-                            timeout=300,
-                            job_name=f"{data['name']}_submit_item_composition",
-                            doctype="BOM",
-                            document_name=data["name"],
-                        )
-
-                    else:
-                        frappe.throw(
-                            f"""
-                            Item: <b>{fetched_item.name}</b> is not registered.
-                            <b>Ensure ALL Items are registered first to submit this composition</b>""",
-                            title="Integration Error",
-                        )
+            fetched_item = items_by_code.get(item["item_code"])
+            if not fetched_item:
+                continue
+
+            if fetched_item.custom_item_registered == 1:
+                payload = {
+                    "itemCd": data["item_code"],
+                    "cpstItemCd": fetched_item.custom_item_code_etims,
+                    "cpstQty": item["qty"],
+                    "regrId": split_user_email(data["registration_id"]),
+                    "regrNm": data["registration_id"],
+                }
+
+                endpoints_builder.headers = headers
+                endpoints_builder.url = url
+                endpoints_builder.payload = payload
+                endpoints_builder.success_callback = partial(
+                    item_composition_submission_on_success,
+                    document_name=data["name"],
+                )
+                endpoints_builder.error_callback = on_error
+
+                frappe.enqueue(
+                    endpoints_builder.make_remote_call,
+                    is_async=True,
+                    queue="default",
+                    timeout=300,
+                    job_name=f"{data['name']}_submit_item_composition",
+                    doctype="BOM",
+                    document_name=data["name"],
+                )
+
+            else:
+                frappe.throw(
+                    f"""
+                    Item: <b>{fetched_item.name}</b> is not registered.
+                    <b>Ensure ALL Items are registered first to submit this composition</b>""",
+                    title="Integration Error",
+                )
 
 
 @frappe.whitelist()
@@ -676,17 +890,57 @@ def create_supplier(supplier_details: dict) -> Document:
 def create_items_from_fetched_registered(request_data: str) -> None:
     data = json.loads(request_data)
 
-    if data["items"]:
-        items = data["items"]
-        for item in items:
-            create_item(item)
+    items = data["items"]
+    if not items:
+        return
 
+    existing_item_codes = set(
+        frappe.get_all(
+            "Item",
+            filters={"item_code": ["in", [item["product_code"] for item in items]]},
+            pluck="item_code",
+        )
+    )
+    new_items = [
+        item for item in items if item["product_code"] not in existing_item_codes
+    ]
+    countries = get_countries_by_code(
+        [item.get("item_code", None) for item in new_items]
+    )
+
+    for item in new_items:
+        create_item(item, countries)
+
+
+def get_countries_by_code(item_codes: list[str | None]) -> dict[str, str]:
+    """Map the country codes embedded in eTIMS item codes to Country names.
 
-def create_item(item: dict | frappe._dict) -> Document:
+    Args:
+        item_codes (list[str | None]): eTIMS item codes. Empty values are skipped
+
+    Returns:
+        dict[str, str]: The country name for each code found
+    """
+    codes = {item_code[:2] for item_code in item_codes if item_code}
+    if not codes:
+        return {}
+
+    return dict(
+        frappe.get_all(
+            COUNTRIES_DOCTYPE_NAME,
+            filters={"code": ["in", list(codes)]},
+            fields=["code", "name"],
+            as_list=True,
+        )
+    )
+
+
+def create_item(
+    item: dict | frappe._dict, countries: dict[str, str] | None = None
+) -> Document:
     item_code = item.get("item_code", None)
 
     new_item = frappe.new_doc("Item")
-    new_item.is_stock_item = 0  # Default to 0
     new_item.item_code = item["product_code"]
     new_item.item_name = item["item_name"]
     new_item.item_group = "All Item Groups"
@@ -697,21 +951,15 @@ def create_item(item: dict | frappe._dict) -> Document:
         item.get("quantity_unit_code", None) or item["unit_of_quantity_code"]
     )
     new_item.custom_taxation_type = item["taxation_type_code"]
+    if countries is None:
+        countries = get_countries_by_code([item_code])
     new_item.custom_etims_country_of_origin = (
-        frappe.get_doc(
-            COUNTRIES_DOCTYPE_NAME,
-            {"code": item_code[:2]},
-            for_update=False,
-        ).name
-        if item_code
-        else None
+        countries.get(item_code[:2]) if item_code else None
     )
-    new_item.custom_product_type = item_code[2:3] if item_code else None
-
-    if item_code and int(item_code[2:3]) != 3:
-        new_item.is_stock_item = 1
-    else:
-        new_item.is_stock_item = 0
+    product_type = item_code[2:3] if item_code else None
+    new_item.custom_product_type = product_type
+    # Product type 3 is a service, which is never stocked
+    new_item.is_stock_item = int(bool(product_type) and product_type != "3")
 
     new_item.custom_item_code_etims = item["item_code"]
     new_item.valuation_rate = item["unit_price"]
@@ -725,30 +973,57 @@ def create_item(item: dict | frappe._dict) -> Document:
     return new_item
 
 
+def get_missing_purchase_items(
+    items: list[dict], existing_item_names: set[str]
+) -> list[dict]:
+    """The purchase lines whose item has to be created before the invoice.
+
+    Lines are matched to items by name and classification when the invoice is
+    built, so an item is created once per distinct pair. Lines sharing a name but
+    not a classification each get their own item.
+
+    Args:
+        items (list[dict]): The purchase lines
+        existing_item_names (set[str]): Names of the lines' items that already exist
+
+    Returns:
+        list[dict]: The first line of each item to create
+    """
+    new_items = {}
+    for item in items:
+        if item["item_name"] not in existing_item_names:
+            new_items.setdefault(
+                (item["item_name"], item.get("item_classification_code")), item
+            )
+
+    return list(new_items.values())
+
+
 @frappe.whitelist()
 def create_purchase_invoice_from_request(request_data: str) -> None:
     data = json.loads(request_data)
 
     if not data.get("company_name"):
-        data["company_name"] = frappe.defaults.get_user_default(
-            "Company"
-        ) or frappe.get_value("Company", {}, "name")
+        data["company_name"] = get_default_company()
 
     # Check if supplier exists
     supplier = None
     if not frappe.db.exists("Supplier", data["supplier_name"], cache=False):
         supplier = create_supplier(data).name
 
-    all_items = []
-    all_existing_items = {
-        item["name"]: item for item in frappe.db.get_all("Item", ["*"])
-    }
+    items = data["items"]
+    item_names = list({item["item_name"] for item in items})
+    existing_item_names = set(
+        frappe.get_all("Item", filters={"name": ["in", item_names]}, pluck="name")
+    )
+
+    new_items = get_missing_purchase_items(items, existing_item_names)
 
-    for received_item in data["items"]:
-        # Check if item exists
-        if received_item["item_name"] not in all_existing_items:
-            created_item = create_item(received_item)
-            all_items.append(created_item)
+    countries = get_countries_by_code(
+        [item.get("item_code", None) for item in new_items]
+    )
+    for received_item in new_items:
+        create_item(received_item, countries)
 
     set_warehouse = frappe.get_value(
         "Warehouse",
@@ -765,7 +1040,6 @@ def create_purchase_invoice_from_request(request_data: str) -> None:
     # Create the Purchase Invoice
     purchase_invoice = frappe.new_doc("Purchase Invoice")
     purchase_invoice.supplier = supplier or data["supplier_name"]
-    purchase_invoice.supplier = supplier or data["supplier_name"]
     purchase_invoice.update_stock = 1
     purchase_invoice.set_warehouse = set_warehouse
     purchase_invoice.branch = data["branch"]
@@ -773,7 +1047,6 @@ def create_purchase_invoice_from_request(request_data: str) -> None:
     purchase_invoice.custom_slade_organisation = data["organisation"]
     purchase_invoice.bill_no = data["supplier_invoice_no"]
     purchase_invoice.bill_date = data["supplier_invoice_date"]
-    purchase_invoice.bill_date = data["supplier_invoice_date"]
 
     if "currency" in data:
         # The "currency" key is only available when creating from Imported Item
@@ -785,17 +1058,13 @@ def create_purchase_invoice_from_request(request_data: str) -> None:
     if "exchange_rate" in data:
         purchase_invoice.conversion_rate = data["exchange_rate"]
 
-    purchase_invoice.set("items", [])
-
     # TODO: Remove Hard-coded values
     purchase_invoice.custom_purchase_type = "Copy"
     purchase_invoice.custom_receipt_type = "Purchase"
     purchase_invoice.custom_payment_type = "CASH"
     purchase_invoice.custom_purchase_status = "Approved"
 
-    company_abbr = frappe.get_value(
-        "Company", {"name": frappe.defaults.get_user_default("Company")}, ["abbr"]
-    )
+    company_abbr = frappe.get_cached_value("Company", data["company_name"], "abbr")
     expense_account = frappe.db.get_value(
         "Account",
         {
@@ -807,21 +1076,25 @@ def create_purchase_invoice_from_request(request_data: str) -> None:
         ["name"],
     )
 
-    for item in data["items"]:
-        matching_item = frappe.get_all(
-            "Item",
-            filters={
-                "item_name": item["item_name"],
-                "custom_item_classification": item["item_classification_code"],
-            },
-            fields=["name"],
+    item_codes = {}
+    for matching_item in frappe.get_all(
+        "Item",
+        filters={"item_name": ["in", item_names]},
+        fields=["name", "item_name", "custom_item_classification"],
+    ):
+        item_codes.setdefault(
+            (matching_item.item_name, matching_item.custom_item_classification),
+            matching_item.name,
         )
-        item_code = matching_item[0]["name"]
-        purchase_invoice.append(
-            "items",
+
+    purchase_invoice.set(
+        "items",
+        [
             {
                 "item_name": item["item_name"],
-                "item_code": item_code,
+                "item_code": item_codes[
+                    (item["item_name"], item["item_classification_code"])
+                ],
                 "qty": item["quantity"],
                 "rate": item["unit_price"],
                 "expense_account": expense_account,
@@ -829,8 +1102,10 @@ def create_purchase_invoice_from_request(request_data: str) -> None:
                 "custom_packaging_unit": item["packaging_unit_code"],
                 "custom_unit_of_quantity": item["quantity_unit_code"],
                 "custom_taxation_type": item["taxation_type_code"],
-            },
-        )
+            }
+            for item in items
+        ],
+    )
 
     purchase_invoice.insert(ignore_mandatory=True)
 
@@ -843,16 +1118,20 @@ def ping_server(request_data: str) -> None:
     server_url = data.get("server_url")
     auth_url = data.get("auth_url")
 
-    async def check_server(url: str) -> tuple:
+    async def check_server(session: aiohttp.ClientSession, url: str) -> tuple:
         try:
-            response = await make_get_request(url)
+            response = await make_get_request(url, session)
             return "Online", response
-        except aiohttp.client_exceptions.ClientConnectorError:
+        except (aiohttp.client_exceptions.ClientConnectorError, asyncio.TimeoutError):
             return "Offline", None
 
     async def main() -> None:
-        server_status, server_response = await check_server(server_url)
-        auth_status, auth_response = await check_server(auth_url)
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as session:
+            (server_status, server_response), (auth_status, _) = await asyncio.gather(
+                check_server(session, server_url), check_server(session, auth_url)
+            )
 
         if server_response:
             frappe.msgprint(f"Server Status: {server_status}\n{server_response}")
@@ -868,17 +1147,24 @@ def ping_server(request_data: str) -> None:
 def create_stock_entry_from_stock_movement(request_data: str) -> None:
     data = json.loads(request_data)
 
-    for item in data["items"]:
-        if not frappe.db.exists("Item", item["item_name"], cache=False):
-            # Create item if item doesn't exist
-            create_item(item)
-
-    # Create stock entry
-    stock_entry = frappe.new_doc("Stock Entry")
-    stock_entry.stock_entry_type = "Material Transfer"
+    item_names = [item["item_name"] for item in data["items"]]
+    existing_item_names = set(
+        frappe.get_all("Item", filters={"name": ["in", item_names]}, pluck="name")
+    )
+    new_items = [
+        item for item in data["items"] if item["item_name"] not in existing_item_names
+    ]
+    countries = get_countries_by_code(
+        [item.get("item_code", None) for item in new_items]
+    )
 
-    stock_entry.set("items", [])
+    for item in new_items:
+        # The same item may appear on several lines
+        if item["item_name"] not in existing_item_names:
+            create_item(item, countries)
+            existing_item_names.add(item["item_name"])
 
+    # Create stock entry
     source_warehouse = frappe.get_value(
         "Warehouse",
         {"custom_branch": data["branch_id"]},
@@ -893,17 +1179,21 @@ def create_stock_entry_from_stock_movement(request_data: str) -> None:
         as_dict=True,
     )
 
-    for item in data["items"]:
-        stock_entry.append(
-            "items",
-            {
-                "s_warehouse": source_warehouse.name,
-                "t_warehouse": target_warehouse.name,
-                "item_code": item["item_name"],
-                "qty": item["quantity"],
-            },
-        )
-
+    stock_entry = frappe.get_doc(
+        {
+            "doctype": "Stock Entry",
+            "stock_entry_type": "Material Transfer",
+            "items": [
+                {
+                    "s_warehouse": source_warehouse.name,
+                    "t_warehouse": target_warehouse.name,
+                    "item_code": item["item_name"],
+                    "qty": item["quantity"],
+                }
+                for item in data["items"]
+            ],
+        }
+    )
     stock_entry.save()
 
     frappe.msgprint(f"Stock Entry {stock_entry.name} created successfully")
@@ -932,15 +1222,19 @@ def get_invoice_details(request_data: str, invoice_type: str) -> None:
 
 @frappe.whitelist()
 def save_uom_category_details(name: str) -> dict | None:
-    item = frappe.get_doc(UOM_CATEGORY_DOCTYPE_NAME, name)
+    item = get_document_values(
+        UOM_CATEGORY_DOCTYPE_NAME,
+        name,
+        ["name", "slade_id", "category_name", "measure_type", "active"],
+    )
 
-    slade_id = item.get("slade_id", None)
+    slade_id = item.slade_id
 
     request_data = {
-        "name": item.get("category_name"),
-        "document_name": item.get("name"),
-        "measure_type": item.get("measure_type"),
-        "active": True if item.get("active") == 1 else False,
+        "name": item.category_name,
+        "document_name": item.name,
+        "measure_type": item.measure_type,
+        "active": bool(item.active),
     }
 
     if slade_id:
@@ -963,8 +1257,8 @@ def save_uom_category_details(name: str) -> dict | None:
 
 
 @frappe.whitelist()
-def sync_uom_category_details(request_data: str) -> None:
-    process_request(
+def sync_uom_category_details(request_data: str) -> str:
+    return enqueue_sync_request(
         request_data,
         "UOMCategorySearchReq",
         uom_category_search_on_success,
@@ -974,22 +1268,34 @@ def sync_uom_category_details(request_data: str) -> None:
 
 @frappe.whitelist()
 def save_uom_details(name: str) -> dict | None:
-    item = frappe.get_doc("UOM", name)
+    item = get_document_values(
+        "UOM",
+        name,
+        [
+            "name",
+            "slade_id",
+            "uom_name",
+            "custom_factor",
+            "custom_uom_type",
+            "custom_category",
+            "active",
+        ],
+    )
 
-    slade_id = item.get("slade_id", None)
+    slade_id = item.slade_id
 
     request_data = {
-        "name": item.get("uom_name"),
-        "document_name": item.get("name"),
-        "factor": item.get("custom_factor"),
-        "uom_type": item.get("custom_uom_type"),
+        "name": item.uom_name,
+        "document_name": item.name,
+        "factor": item.custom_factor,
+        "uom_type": item.custom_uom_type,
         "category": get_link_value(
             UOM_CATEGORY_DOCTYPE_NAME,
             "name",
-            item.get("custom_category"),
+            item.custom_category,
             "slade_id",
         ),
-        "active": True if item.get("active") == 1 else False,
+        "active": bool(item.active),
     }
 
     if slade_id:
@@ -1012,8 +1318,8 @@ def save_uom_details(name: str) -> dict | None:
 
 
 @frappe.whitelist()
-def sync_uom_details(request_data: str) -> None:
-    process_request(
+def sync_uom_details(request_data: str) -> str:
+    return enqueue_sync_request(
         request_data,
         "UOMDetailSearchReq",
         uom_search_on_success,
@@ -1023,26 +1329,41 @@ def sync_uom_details(request_data: str) -> None:
 
 @frappe.whitelist()
 def submit_uom_list() -> dict | None:
+    # Set once a scan finds nothing to send, and cleared whenever a UOM changes
+    if frappe.cache().get_value(ALL_UOMS_SYNCED_CACHE_KEY):
+        return
+
     uoms = frappe.get_all(
-        "UOM", filters={"custom_slade_id": ["is", "not set"]}, fields=["name"]
-    )
-    request_data = []
-    for uom in uoms:
-        item = frappe.get_doc("UOM", uom.name)
-        category = item.get("custom_category") or "Unit"
-        item_data = {
-            "name": item.get("uom_name"),
-            "factor": item.get("custom_factor"),
-            "uom_type": item.get("custom_uom_type") or "reference",
-            "category": get_link_value(
-                UOM_CATEGORY_DOCTYPE_NAME,
-                "name",
-                category,
-                "slade_id",
-            ),
-            "active": True if item.get("active") == 1 else False,
+        "UOM",
+        filters={"custom_slade_id": ["is", "not set"]},
+        fields=[
+            "uom_name",
+            "custom_factor",
+            "custom_uom_type",
+            "custom_category",
+            "active",
+        ],
+    )
+    if not uoms:
+        frappe.cache().set_value(ALL_UOMS_SYNCED_CACHE_KEY, True)
+        return
+
+    categories = get_link_value_map(
+        UOM_CATEGORY_DOCTYPE_NAME,
+        "name",
+        {item.custom_category or "Unit" for item in uoms},
+        "slade_id",
+    )
+    request_data = [
+        {
+            "name": item.uom_name,
+            "factor": item.custom_factor,
+            "uom_type": item.custom_uom_type or "reference",
+            "category": categories.get(item.custom_category or "Unit"),
+            "active": bool(item.active),
         }
-        request_data.append(item_data)
+        for item in uoms
+    ]
 
     process_request(
         request_data,
@@ -1054,16 +1375,16 @@ def submit_uom_list() -> dict | None:
 
 
 @frappe.whitelist()
-def sync_warehouse_details(request_data: str, type: str = "warehouse") -> None:
+def sync_warehouse_details(request_data: str, type: str = "warehouse") -> str:
     if type == "warehouse":
-        process_request(
+        return enqueue_sync_request(
             request_data,
             "WarehouseSearchReq",
             warehouse_search_on_success,
             doctype="Warehouse",
         )
     else:
-        process_request(
+        return enqueue_sync_request(
             request_data,
             "LocationSearchReq",
             location_search_on_success,
@@ -1073,31 +1394,60 @@ def sync_warehouse_details(request_data: str, type: str = "warehouse") -> None:
 
 @frappe.whitelist()
 def save_warehouse_details(name: str) -> dict | None:
-    item = frappe.get_doc("Warehouse", name)
-    slade_id = item.get("custom_slade_id", None)
-    is_group = item.get("is_group", 0)
+    item = get_document_values("Warehouse", name, WAREHOUSE_FIELDS)
+    send_warehouse_details(item)
+
+
+@frappe.whitelist()
+def bulk_save_warehouse_details(docs_list: str) -> None:
+    # Each warehouse is a request of its own, so they're sent from the background
+    frappe.enqueue(
+        send_warehouse_list,
+        queue="long",
+        job_name=f"bulk_warehouse_submission_{token_hex(8)}",
+        names=json.loads(docs_list),
+    )
+
+
+def send_warehouse_list(names: list[str]) -> None:
+    warehouses = get_documents_values("Warehouse", names, WAREHOUSE_FIELDS)
+
+    # Resolve the linked ids for the whole batch up front. The lookups made while
+    # building each request are then answered from the request cache
+    get_link_value_map(
+        "Branch", "name", (item.branch for item in warehouses), "slade_id"
+    )
+    get_link_value_map(
+        "Warehouse",
+        "name",
+        (item.parent_warehouse for item in warehouses),
+        "custom_slade_id",
+    )
+
+    for item in warehouses:
+        send_warehouse_details(item)
+
+
+def send_warehouse_details(item: frappe._dict) -> None:
+    slade_id = item.custom_slade_id
+    is_group = item.is_group
 
     route_key = "WarehousesSearchReq"
     on_success = warehouse_update_on_success
 
     request_data = {
-        "name": item.get("warehouse_name"),
-        "document_name": item.get("name"),
-        "organisation": get_link_value(
-            "Company",
-            "name",
-            item.get("company"),
-            "custom_slade_id",
-        ),
-        "active": False if item.get("disabled") == 1 else True,
+        "name": item.warehouse_name,
+        "document_name": item.name,
+        "organisation": get_master_slade_id("Company", item.company),
+        "active": not item.disabled,
     }
 
     if not is_group:
         request_data["branch"] = get_link_value(
-            "Branch", "name", item.get("branch"), "slade_id"
+            "Branch", "name", item.branch, "slade_id"
         )
         request_data["warehouse"] = get_link_value(
-            "Warehouse", "name", item.get("parent_warehouse"), "custom_slade_id"
+            "Warehouse", "name", item.parent_warehouse, "custom_slade_id"
         )
         route_key = "LocationsSearchReq"
 
@@ -1118,49 +1468,67 @@ def save_warehouse_details(name: str) -> dict | None:
 
 @frappe.whitelist()
 def submit_pricelist(name: str) -> dict | None:
-    item = frappe.get_doc("Price List", name)
-    slade_id = item.get("custom_slade_id", None)
+    item = get_document_values("Price List", name, PRICELIST_FIELDS)
+    send_pricelist_details(item)
+
+
+@frappe.whitelist()
+def bulk_submit_pricelists(docs_list: str) -> None:
+    # Each price list is a request of its own, so they're sent from the background
+    frappe.enqueue(
+        send_pricelist_list,
+        queue="long",
+        job_name=f"bulk_pricelist_submission_{token_hex(8)}",
+        names=json.loads(docs_list),
+    )
+
+
+def send_pricelist_list(names: list[str]) -> None:
+    pricelists = get_documents_values("Price List", names, PRICELIST_FIELDS)
+
+    # Resolve the linked ids for the whole batch up front. The lookups made while
+    # building each request are then answered from the request cache
+    get_link_value_map(
+        "Warehouse",
+        "name",
+        (item.custom_warehouse for item in pricelists),
+        "custom_slade_id",
+    )
+
+    for item in pricelists:
+        send_pricelist_details(item)
+
+
+def send_pricelist_details(item: frappe._dict) -> None:
+    slade_id = item.custom_slade_id
 
     route_key = "PriceListsSearchReq"
     on_success = pricelist_update_on_success
 
     # pricelist_type is mandatory for the request and cannot accept both selling and buying
-    pricelist_type = (
-        "selling"
-        if item.get("selling") == 1
-        else "purchases" if item.get("buying") == 1 else "selling"
-    )
+    pricelist_type = "purchases" if item.buying and not item.selling else "selling"
     request_data = {
-        "name": item.get("price_list_name"),
-        "document_name": item.get("name"),
-        "pricelist_status": item.get("custom_pricelist_status"),
+        "name": item.price_list_name,
+        "document_name": item.name,
+        "pricelist_status": item.custom_pricelist_status,
         "pricelist_type": pricelist_type,
-        "organisation": get_link_value(
-            "Company",
-            "name",
-            item.get("custom_company"),
-            "custom_slade_id",
-        ),
-        "active": False if item.get("enabled") == 0 else True,
+        "organisation": get_master_slade_id("Company", item.custom_company),
+        "active": item.enabled != 0,
     }
 
-    if item.get("custom_warehouse"):
+    if item.custom_warehouse:
         request_data["location"] = get_link_value(
             "Warehouse",
             "name",
-            item.get("custom_warehouse"),
+            item.custom_warehouse,
             "custom_slade_id",
         )
 
-    if item.get("custom_effective_from"):
-        request_data["effective_from"] = item.get("custom_effective_from").strftime(
-            "%Y-%m-%d"
-        )
+    if item.custom_effective_from:
+        request_data["effective_from"] = getdate(item.custom_effective_from).isoformat()
 
-    if item.get("custom_effective_to"):
-        request_data["effective_to"] = item.get("custom_effective_to").strftime(
-            "%Y-%m-%d"
-        )
+    if item.custom_effective_to:
+        request_data["effective_to"] = getdate(item.custom_effective_to).isoformat()
 
     if slade_id:
         request_data["id"] = slade_id
@@ -1178,8 +1546,8 @@ def submit_pricelist(name: str) -> dict | None:
 
 
 @frappe.whitelist()
-def sync_pricelist(request_data: str) -> None:
-    process_request(
+def sync_pricelist(request_data: str) -> str:
+    return enqueue_sync_request(
         request_data,
         "PriceListSearchReq",
         pricelist_update_on_success,
@@ -1189,43 +1557,41 @@ def sync_pricelist(request_data: str) -> None:
 
 @frappe.whitelist()
 def submit_item_price(name: str) -> dict | None:
-    item = frappe.get_doc("Item Price", name)
-    slade_id = item.get("custom_slade_id", None)
-    item_code = item.get("item_code", None)
-    item_name = item.get("name", None)
+    item = get_document_values(
+        "Item Price",
+        name,
+        [
+            "name",
+            "custom_slade_id",
+            "item_code",
+            "price_list_rate",
+            "custom_company",
+            "currency",
+            "price_list",
+            "enabled",
+        ],
+    )
+    slade_id = item.custom_slade_id
+    item_code = item.item_code
+    item_name = item.name
 
     route_key = "ItemPricesSearchReq"
     on_success = item_price_update_on_success
 
+    links = {
+        "product": ("Item", "name", item_code, "custom_slade_id"),
+        "pricelist": ("Price List", "name", item.price_list, "custom_slade_id"),
+    }
+    slade_ids = resolve_slade_ids(links.values())
+
     request_data = {
         "name": f"{item_code} - {item_name}",
         "document_name": item_name,
-        "price_inclusive_tax": item.get("price_list_rate"),
-        "organisation": get_link_value(
-            "Company",
-            "name",
-            item.get("custom_company"),
-            "custom_slade_id",
-        ),
-        "product": get_link_value(
-            "Item",
-            "name",
-            item_code,
-            "custom_slade_id",
-        ),
-        "currency": get_link_value(
-            "Currency",
-            "name",
-            item.get("currency"),
-            "custom_slade_id",
-        ),
-        "pricelist": get_link_value(
-            "Price List",
-            "name",
-            item.get("price_list"),
-            "custom_slade_id",
-        ),
-        "active": False if item.get("enabled") == 0 else True,
+        "price_inclusive_tax": item.price_list_rate,
+        "organisation": get_master_slade_id("Company", item.custom_company),
+        "currency": get_master_slade_id("Currency", item.currency),
+        **{key: slade_ids[lookup] for key, lookup in links.items()},
+        "active": item.enabled != 0,
     }
 
     if slade_id:
@@ -1244,8 +1610,8 @@ def submit_item_price(name: str) -> dict | None:
 
 
 @frappe.whitelist()
-def sync_item_price(request_data: str) -> None:
-    process_request(
+def sync_item_price(request_data: str) -> str:
+    return enqueue_sync_request(
         request_data,
         "ItemPriceSearchReq",
         item_price_update_on_success,
@@ -1257,46 +1623,46 @@ def sync_item_price(request_data: str) -> None:
 def save_operation_type(
     name: str, on_success: Callable = operation_type_create_on_success
 ) -> dict | None:
-    item = frappe.get_doc(OPERATION_TYPE_DOCTYPE_NAME, name)
-    slade_id = item.get("slade_id", None)
+    item = get_document_values(
+        OPERATION_TYPE_DOCTYPE_NAME,
+        name,
+        [
+            "name",
+            "slade_id",
+            "operation_name",
+            "operation_type",
+            "company",
+            "branch",
+            "destination_location",
+            "source_location",
+            "transit_location",
+            "active",
+        ],
+    )
+    slade_id = item.slade_id
 
     route_key = "OperationTypesReq"
 
+    links = {
+        "branch": ("Branch", "name", item.branch, "slade_id"),
+        **{
+            location: ("Warehouse", "name", item.get(location), "custom_slade_id")
+            for location in (
+                "destination_location",
+                "source_location",
+                "transit_location",
+            )
+        },
+    }
+    slade_ids = resolve_slade_ids(links.values())
+
     request_data = {
-        "operation_name": item.get("operation_name"),
-        "document_name": item.get("name"),
-        "operation_type": item.get("operation_type"),
-        "organisation": get_link_value(
-            "Company",
-            "name",
-            item.get("company"),
-            "custom_slade_id",
-        ),
-        "branch": get_link_value(
-            "Branch",
-            "name",
-            item.get("branch"),
-            "slade_id",
-        ),
-        "destination_location": get_link_value(
-            "Warehouse",
-            "name",
-            item.get("destination_location"),
-            "custom_slade_id",
-        ),
-        "source_location": get_link_value(
-            "Warehouse",
-            "name",
-            item.get("source_location"),
-            "custom_slade_id",
-        ),
-        "transit_location": get_link_value(
-            "Warehouse",
-            "name",
-            item.get("transit_location"),
-            "custom_slade_id",
-        ),
-        "active": False if item.get("active") == 0 else True,
+        "operation_name": item.operation_name,
+        "document_name": item.name,
+        "operation_type": item.operation_type,
+        "organisation": get_master_slade_id("Company", item.company),
+        **{key: slade_ids[lookup] for key, lookup in links.items()},
+        "active": item.active != 0,
     }
 
     if slade_id:
@@ -1316,8 +1682,8 @@ def save_operation_type(
 
 
 @frappe.whitelist()
-def sync_operation_type(request_data: str) -> None:
-    process_request(
+def sync_operation_type(request_data: str) -> str:
+    return enqueue_sync_request(
         request_data,
         "OperationTypeReq",
         operation_types_search_on_success,
@@ -1,8 +1,7 @@
 from datetime import datetime
-from io import BytesIO
+from operator import itemgetter
 
 import deprecation
-import qrcode
 
 import frappe
 
@@ -14,16 +13,74 @@ from ..doctype.doctype_names_mapping import (
     NOTICES_DOCTYPE_NAME,
     OPERATION_TYPE_DOCTYPE_NAME,
     PACKAGING_UNIT_DOCTYPE_NAME,
+    PAYMENT_TYPE_DOCTYPE_NAME,
     REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME,
     REGISTERED_PURCHASES_DOCTYPE_NAME,
     REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM,
     REGISTERED_STOCK_MOVEMENTS_DOCTYPE_NAME,
+    REGISTERED_STOCK_MOVEMENTS_ITEM_DOCTYPE_NAME,
     TAXATION_TYPE_DOCTYPE_NAME,
     UNIT_OF_QUANTITY_DOCTYPE_NAME,
     USER_DOCTYPE_NAME,
 )
 from ..handlers import handle_errors, handle_slade_errors
-from ..utils import get_link_value, get_or_create_link
+from ..utils import (
+    bulk_insert_records,
+    flush_pending_updates,
+    get_link_value,
+    get_link_value_map,
+    get_or_create_code_link_map,
+    get_or_create_link,
+    get_qr_code_bytes,
+    queue_pending_update,
+)
+
+# Fields copied verbatim from eTims/Slade payloads, as {fieldname: payload key}
+PURCHASE_ITEM_FIELD_MAP = {
+    "slade_id": "id",
+    "item_name": "item_name",
+    "purchase_invoice": "purchase_invoice",
+    "product_name": "product_name",
+    "product_code": "product_code",
+    "item_code": "item_code",
+    "item_classification_code_data": "item_classification_code",
+    "item_sequence": "item_sequence_number",
+    "barcode": "barcode",
+    "package": "package",
+    "packaging_unit_code": "package_unit_code",
+    "quantity": "quantity",
+    "quantity_unit_code": "quantity_unit_code",
+    "unit_price": "unit_price",
+    "supply_amount": "supply_amount",
+    "discount_rate": "discount_rate",
+    "discount_amount": "discount_amount",
+    "taxation_type_code": "taxation_type_code",
+    "taxable_amount": "taxable_amount",
+    "tax_amount": "tax_amount",
+    "total_amount": "total_amount",
+}
+get_purchase_item_values = itemgetter(*PURCHASE_ITEM_FIELD_MAP.values())
+
+STOCK_MOVEMENT_ITEM_FIELD_MAP = {
+    "item_name": "itemNm",
+    "item_sequence": "itemSeq",
+    "item_code": "itemCd",
+    "barcode": "bcd",
+    "item_classification_code": "itemClsCd",
+    "packaging_unit_code": "pkgUnitCd",
+    "unit_of_quantity_code": "qtyUnitCd",
+    "package": "pkg",
+    "quantity": "qty",
+    "item_expiry_date": "itemExprDt",
+    "unit_price": "prc",
+    "supply_amount": "splyAmt",
+    "discount_rate": "totDcAmt",
+    "taxable_amount": "taxblAmt",
+    "tax_amount": "taxAmt",
+    "taxation_type_code": "taxTyCd",
+    "total_amount": "totAmt",
+}
+get_stock_movement_item_values = itemgetter(*STOCK_MOVEMENT_ITEM_FIELD_MAP.values())
 
 
 def on_error(
@@ -93,6 +150,7 @@ def customer_search_on_success(
             "custom_location_name": response["physical_address"],
             "custom_is_validated": 1,
         },
+        update_modified=False,
     )
 
 
@@ -102,7 +160,7 @@ def item_registration_on_success(response: dict, document_name: str, **kwargs) -
         "custom_slade_id": response.get("id"),
         "custom_sent_to_slade": 1,
     }
-    frappe.db.set_value("Item", document_name, updates)
+    frappe.db.set_value("Item", document_name, updates, update_modified=False)
     frappe.enqueue(
         "kenya_compliance_via_slade.kenya_compliance_via_slade.apis.apis.submit_inventory",
         name=document_name,
@@ -128,6 +186,7 @@ def customer_branch_details_submission_on_success(
         doctype,
         document_name,
         {"custom_details_submitted_successfully": 1, "slade_id": response.get("id")},
+        update_modified=False,
     )
 
 
@@ -144,6 +203,7 @@ def user_details_submission_on_success(
             "slade_id": response.get("id"),
             "sent_to_slade": 1,
         },
+        update_modified=False,
     )
 
 
@@ -219,7 +279,12 @@ def inventory_submission_on_success(
 def imported_item_submission_on_success(
     response: dict, document_name: str, **kwargs
 ) -> None:
-    frappe.db.set_value("Item", document_name, {"custom_imported_item_submitted": 1})
+    frappe.db.set_value(
+        "Item",
+        document_name,
+        {"custom_imported_item_submitted": 1},
+        update_modified=False,
+    )
 
 
 def submit_inventory_on_success(response: dict, document_name: str, **kwargs) -> None:
@@ -284,6 +349,7 @@ def sales_information_submission_on_success(
             "custom_slade_id": response.get("id"),
             "custom_successfully_submitted": 1,
         },
+        update_modified=False,
     )
     frappe.enqueue(
         "kenya_compliance_via_slade.kenya_compliance_via_slade.apis.remote_response_status_handlers.process_invoice_items",
@@ -409,42 +475,41 @@ def update_invoice_info(response: dict, **kwargs) -> None:
         "custom_scu_invoice_number": scu_data.get("scu_invoice_number"),
     }
 
-    # Generate QR Code image if qr_code_url is available
-    if qr_code_url:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_code_url)
-        qr.make(fit=True)
-
-        # Save QR Code image as binary
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
+    document_name = frappe.db.get_value(
+        doctype, {"custom_slade_id": custom_slade_id}, "name"
+    )
+    if not document_name:
+        return
 
-        # Attach the QR code image to the document and get the file URL
-        file_doc = frappe.get_doc(
+    # Store the QR Code as a file attached to the invoice, reusing the one saved
+    # by an earlier submission of the same receipt if present
+    if qr_code_url:
+        file_name = f"QR-{custom_slade_id}.png"
+        updates["custom_qr_code"] = frappe.db.get_value(
+            "File",
             {
-                "doctype": "File",
-                "file_name": f"QR-{custom_slade_id}.png",
-                "is_private": 1,
-                "content": buffer.read(),
                 "attached_to_doctype": doctype,
-                "attached_to_name": custom_slade_id,
-            }
+                "attached_to_name": document_name,
+                "file_name": file_name,
+            },
+            "file_url",
         )
-        file_doc.save()
-        updates["custom_qr_code"] = file_doc.file_url
 
-    document_name = frappe.db.get_value(
-        doctype, {"custom_slade_id": custom_slade_id}, "name"
-    )
-    if document_name:
-        frappe.db.set_value(doctype, document_name, updates)
+        if not updates["custom_qr_code"]:
+            file_doc = frappe.get_doc(
+                {
+                    "doctype": "File",
+                    "file_name": file_name,
+                    "is_private": 1,
+                    "content": get_qr_code_bytes(qr_code_url),
+                    "attached_to_doctype": doctype,
+                    "attached_to_name": document_name,
+                }
+            )
+            file_doc.save(ignore_permissions=True)
+            updates["custom_qr_code"] = file_doc.file_url
+
+    frappe.db.set_value(doctype, document_name, updates)
 
 
 def sales_item_submission_on_success(
@@ -461,7 +526,10 @@ def item_composition_submission_on_success(
     response: dict, document_name: str, **kwargs
 ) -> None:
     frappe.db.set_value(
-        "BOM", document_name, {"custom_item_composition_submitted_successfully": 1}
+        "BOM",
+        document_name,
+        {"custom_item_composition_submitted_successfully": 1},
+        update_modified=False,
     )
 
 
@@ -475,6 +543,7 @@ def purchase_invoice_submission_on_success(
             "custom_slade_id": response.get("id"),
             "custom_submitted_successfully": 1,
         },
+        update_modified=False,
     )
 
 
@@ -484,8 +553,13 @@ def purchase_search_on_success(response: dict, **kwargs) -> None:
         if isinstance(response, dict)
         else response if isinstance(response, list) else [response]
     )
+    payment_types = get_link_value_map(
+        PAYMENT_TYPE_DOCTYPE_NAME,
+        "code",
+        (sale.get("payment_type_code") for sale in sales_list),
+    )
     for sale in sales_list:
-        registered_purchase = create_purchase_from_search_details(sale)
+        registered_purchase = create_purchase_from_search_details(sale, payment_types)
         frappe.enqueue(
             "kenya_compliance_via_slade.kenya_compliance_via_slade.apis.remote_response_status_handlers.fetch_purchase_items",
             registered_purchase=registered_purchase,
@@ -510,6 +584,17 @@ def fetch_purchase_items(registered_purchase: str) -> None:
     )
 
 
+def iso_to_db_datetime(date_str: str) -> str:
+    """Convert an ISO 8601 timestamp to the 'YYYY-MM-DD HH:MM:SS' form stored in
+    the database, keeping the wall-clock time and dropping any timezone offset.
+
+    Full timestamps are sliced directly; anything shorter is parsed."""
+    if len(date_str) >= 19:
+        return f"{date_str[:10]} {date_str[11:19]}"
+
+    return datetime.fromisoformat(date_str).strftime("%Y-%m-%d %H:%M:%S")
+
+
 def parse_datetime(date_str: str, format: str = "%Y-%m-%dT%H:%M:%S%z") -> str:
     if not date_str:
         return
@@ -523,70 +608,76 @@ def parse_datetime(date_str: str, format: str = "%Y-%m-%dT%H:%M:%S%z") -> str:
         return None
 
 
-def create_purchase_from_search_details(fetched_purchase: dict) -> str:
+def create_purchase_from_search_details(
+    fetched_purchase: dict, payment_types: dict[str, str] | None = None
+) -> str:
     """
     Create and submit a new registered purchase document using details from fetched_purchase.
+
+    payment_types optionally maps payment type codes to record names, as preloaded
+    by the caller. Without it the payment type is looked up directly.
     """
+    purchase_details = {
+        "slade_id": fetched_purchase["id"],
+        "supplier_name": fetched_purchase["supplier_name"],
+        "supplier_pin": fetched_purchase["supplier_pin"],
+        "supplier_branch_id": fetched_purchase["supplier_branch_id"],
+        "supplier_invoice_number": fetched_purchase["supplier_invoice_number"],
+        "receipt_type_code": fetched_purchase["receipt_type_code"],
+        "validated_date": parse_datetime(fetched_purchase["validated_date"]),
+        "sales_date": parse_datetime(fetched_purchase["sale_date"]),
+        "stock_released_date": parse_datetime(fetched_purchase["stock_released_date"]),
+        "remarks": fetched_purchase["remark"],
+        "total_item_count": fetched_purchase["total_item_count"],
+        "total_taxable_amount": fetched_purchase["total_taxable_amount"],
+        "total_tax_amount": fetched_purchase["total_tax_amount"],
+        "total_amount": fetched_purchase["total_amount"],
+        "taxable_amount_a": fetched_purchase.get("taxable_amount_A", 0.0),
+        "taxable_amount_b": fetched_purchase.get("taxable_amount_B", 0.0),
+        "taxable_amount_c": fetched_purchase.get("taxable_amount_C", 0.0),
+        "taxable_amount_d": fetched_purchase.get("taxable_amount_D", 0.0),
+        "taxable_amount_e": fetched_purchase.get("taxable_amount_E", 0.0),
+        "tax_rate_a": fetched_purchase.get("tax_rate_A", 0.0),
+        "tax_rate_b": fetched_purchase.get("tax_rate_B", 0.0),
+        "tax_rate_c": fetched_purchase.get("tax_rate_C", 0.0),
+        "tax_rate_d": fetched_purchase.get("tax_rate_D", 0.0),
+        "tax_rate_e": fetched_purchase.get("tax_rate_E", 0.0),
+        "tax_amount_a": fetched_purchase.get("tax_amount_A", 0.0),
+        "tax_amount_b": fetched_purchase.get("tax_amount_B", 0.0),
+        "tax_amount_c": fetched_purchase.get("tax_amount_C", 0.0),
+        "tax_amount_d": fetched_purchase.get("tax_amount_D", 0.0),
+        "tax_amount_e": fetched_purchase.get("tax_amount_E", 0.0),
+        "workflow_state": fetched_purchase["workflow_state"],
+        "branch": get_link_value("Branch", "slade_id", fetched_purchase["branch"]),
+        "organisation": get_link_value(
+            "Company", "custom_slade_id", fetched_purchase["organisation"]
+        ),
+        "can_send_to_etims": fetched_purchase["can_send_to_etims"],
+    }
+    payment_type_code = fetched_purchase.get("payment_type_code")
+    if payment_type_code:
+        purchase_details["payment_type_code"] = (
+            payment_types.get(payment_type_code)
+            if payment_types is not None
+            else frappe.db.get_value(
+                PAYMENT_TYPE_DOCTYPE_NAME, {"code": payment_type_code}, "name"
+            )
+        )
+
     existing_doc = frappe.get_value(
         REGISTERED_PURCHASES_DOCTYPE_NAME, {"slade_id": fetched_purchase["id"]}, "name"
     )
 
     if existing_doc:
         doc = frappe.get_doc(REGISTERED_PURCHASES_DOCTYPE_NAME, existing_doc)
+        doc.update(purchase_details)
     else:
-        doc = frappe.new_doc(REGISTERED_PURCHASES_DOCTYPE_NAME)
+        doc = frappe.get_doc(
+            {"doctype": REGISTERED_PURCHASES_DOCTYPE_NAME, **purchase_details}
+        )
 
     doc.flags.ignore_permissions = True
     doc.flags.ignore_validate_update_after_submit = True
-    doc.slade_id = fetched_purchase["id"]
-
-    doc.supplier_name = fetched_purchase["supplier_name"]
-    doc.supplier_pin = fetched_purchase["supplier_pin"]
-    doc.supplier_branch_id = fetched_purchase["supplier_branch_id"]
-    doc.supplier_invoice_number = fetched_purchase["supplier_invoice_number"]
-
-    doc.receipt_type_code = fetched_purchase["receipt_type_code"]
-    if fetched_purchase.get("payment_type_code"):
-        doc.payment_type_code = frappe.get_doc(
-            "Navari KRA eTims Payment Type",
-            {"code": fetched_purchase["payment_type_code"]},
-            ["name"],
-        ).name
-
-    doc.validated_date = parse_datetime(fetched_purchase["validated_date"])
-    doc.sales_date = parse_datetime(fetched_purchase["sale_date"])
-    doc.stock_released_date = parse_datetime(fetched_purchase["stock_released_date"])
-    doc.remarks = fetched_purchase["remark"]
-
-    doc.total_item_count = fetched_purchase["total_item_count"]
-    doc.total_taxable_amount = fetched_purchase["total_taxable_amount"]
-    doc.total_tax_amount = fetched_purchase["total_tax_amount"]
-    doc.total_amount = fetched_purchase["total_amount"]
-
-    doc.taxable_amount_a = fetched_purchase.get("taxable_amount_A", 0.0)
-    doc.taxable_amount_b = fetched_purchase.get("taxable_amount_B", 0.0)
-    doc.taxable_amount_c = fetched_purchase.get("taxable_amount_C", 0.0)
-    doc.taxable_amount_d = fetched_purchase.get("taxable_amount_D", 0.0)
-    doc.taxable_amount_e = fetched_purchase.get("taxable_amount_E", 0.0)
-
-    doc.tax_rate_a = fetched_purchase.get("tax_rate_A", 0.0)
-    doc.tax_rate_b = fetched_purchase.get("tax_rate_B", 0.0)
-    doc.tax_rate_c = fetched_purchase.get("tax_rate_C", 0.0)
-    doc.tax_rate_d = fetched_purchase.get("tax_rate_D", 0.0)
-    doc.tax_rate_e = fetched_purchase.get("tax_rate_E", 0.0)
-
-    doc.tax_amount_a = fetched_purchase.get("tax_amount_A", 0.0)
-    doc.tax_amount_b = fetched_purchase.get("tax_amount_B", 0.0)
-    doc.tax_amount_c = fetched_purchase.get("tax_amount_C", 0.0)
-    doc.tax_amount_d = fetched_purchase.get("tax_amount_D", 0.0)
-    doc.tax_amount_e = fetched_purchase.get("tax_amount_E", 0.0)
-
-    doc.workflow_state = fetched_purchase["workflow_state"]
-    doc.branch = (get_link_value("Branch", "slade_id", fetched_purchase["branch"]),)
-    doc.organisation = (
-        get_link_value("Company", "custom_slade_id", fetched_purchase["organisation"]),
-    )
-    doc.can_send_to_etims = fetched_purchase["can_send_to_etims"]
 
     try:
         doc.submit()
@@ -600,171 +691,206 @@ def create_purchase_from_search_details(fetched_purchase: dict) -> str:
 
 def create_and_link_purchase_item(response: dict, document_name: str, **kwargs) -> None:
     item_list = response if isinstance(response, list) else response.get("results")
-    parent_record = frappe.get_doc(REGISTERED_PURCHASES_DOCTYPE_NAME, document_name)
-    parent_record.flags.ignore_permissions = True
-    parent_record.flags.ignore_validate_update_after_submit = True
+    if not item_list:
+        return
 
+    classification_codes = {item["item_classification_code"] for item in item_list}
+    classifications = get_link_value_map(
+        ITEM_CLASSIFICATIONS_DOCTYPE_NAME, "itemclscd", classification_codes
+    )
+    missing_classifications = [
+        {"name": code, "itemclscd": code}
+        for code in classification_codes
+        if code and code not in classifications
+    ]
+    bulk_insert_records(ITEM_CLASSIFICATIONS_DOCTYPE_NAME, missing_classifications)
+    classifications.update(
+        (record["name"], record["name"]) for record in missing_classifications
+    )
+
+    existing_items = set(
+        frappe.get_all(
+            REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM,
+            filters={"slade_id": ["in", [item["id"] for item in item_list]]},
+            pluck="slade_id",
+        )
+    )
+    docstatus = frappe.db.get_value(
+        REGISTERED_PURCHASES_DOCTYPE_NAME, document_name, "docstatus"
+    )
+    next_idx = (
+        frappe.db.count(
+            REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM,
+            {"parent": document_name, "parenttype": REGISTERED_PURCHASES_DOCTYPE_NAME},
+        )
+        + 1
+    )
+
+    new_items = []
     for item in item_list:
-        existing_item = frappe.get_all(
-            REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM, filters={"slade_id": item["id"]}
+        registered_item = dict(
+            zip(PURCHASE_ITEM_FIELD_MAP, get_purchase_item_values(item)),
+            parent=document_name,
+            parentfield="items",
+            parenttype=REGISTERED_PURCHASES_DOCTYPE_NAME,
+            is_mapped=1 if item["is_mapped"] else 0,
+            item_classification_code=classifications.get(
+                item["item_classification_code"]
+            ),
         )
 
-        if existing_item:
-            registered_item = frappe.get_doc(
-                REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM, item["id"]
+        if item["id"] in existing_items:
+            queue_pending_update(
+                REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM, item["id"], registered_item
             )
-            registered_item.flags.ignore_permissions = True
-            registered_item.flags.ignore_validate_update_after_submit = True
         else:
-            registered_item = frappe.new_doc(REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM)
-            registered_item.parent = parent_record.name
-            registered_item.parentfield = "items"
-            registered_item.parenttype = REGISTERED_PURCHASES_DOCTYPE_NAME
-
-        registered_item.slade_id = item["id"]
-        registered_item.item_name = item["item_name"]
-        registered_item.purchase_invoice = item["purchase_invoice"]
-        registered_item.is_mapped = 1 if item["is_mapped"] else 0
-        registered_item.product_name = item["product_name"]
-        registered_item.product_code = item["product_code"]
-        registered_item.item_code = item["item_code"]
-        registered_item.item_classification_code_data = item["item_classification_code"]
-        registered_item.item_classification_code = get_or_create_link(
-            ITEM_CLASSIFICATIONS_DOCTYPE_NAME,
-            "itemclscd",
-            item["item_classification_code"],
-        )
-        registered_item.item_sequence = item["item_sequence_number"]
-        registered_item.barcode = item["barcode"]
-        registered_item.package = item["package"]
-        registered_item.packaging_unit_code = item["package_unit_code"]
-        registered_item.quantity = item["quantity"]
-        registered_item.quantity_unit_code = item["quantity_unit_code"]
-        registered_item.unit_price = item["unit_price"]
-        registered_item.supply_amount = item["supply_amount"]
-        registered_item.discount_rate = item["discount_rate"]
-        registered_item.discount_amount = item["discount_amount"]
-        registered_item.taxation_type_code = item["taxation_type_code"]
-        registered_item.taxable_amount = item["taxable_amount"]
-        registered_item.tax_amount = item["tax_amount"]
-        registered_item.total_amount = item["total_amount"]
-        registered_item.save()
-
-        parent_record.append("items", registered_item)
-
-    parent_record.save()
+            registered_item.update(
+                {"name": item["id"], "idx": next_idx, "docstatus": docstatus}
+            )
+            new_items.append(registered_item)
+            next_idx += 1
+
+    bulk_insert_records(REGISTERED_PURCHASES_DOCTYPE_NAME_ITEM, new_items)
+    flush_pending_updates()
 
 
 def notices_search_on_success(response: dict | list, **kwargs) -> None:
     notices = response if isinstance(response, list) else response.get("results")
-    if isinstance(notices, list):
-        for notice in notices:
-            create_notice_if_new(notice)
-    else:
+    if not isinstance(notices, list):
         frappe.log_error(
             title="Invalid Response Format",
             message="Expected a list or single notice in the response",
         )
+        return
 
-
-def create_notice_if_new(notice: dict) -> None:
-    exists = frappe.db.exists(
-        NOTICES_DOCTYPE_NAME, {"notice_number": notice.get("notice_number")}
+    existing_notices = set(
+        frappe.get_all(
+            NOTICES_DOCTYPE_NAME,
+            filters={
+                "notice_number": [
+                    "in",
+                    [notice.get("notice_number") for notice in notices],
+                ]
+            },
+            pluck="notice_number",
+        )
     )
-    if exists:
-        return
 
-    doc = frappe.new_doc(NOTICES_DOCTYPE_NAME)
-    doc.flags.ignore_permissions = True
-    doc.flags.ignore_validate_update_after_submit = True
-    doc.update(
-        {
-            "notice_number": notice.get("notice_number"),
+    # Notices are not submittable and have no controller hooks, so they are
+    # written directly instead of going through save()
+    new_notices = {}
+    for notice in notices:
+        notice_number = notice.get("notice_number")
+        if notice_number in existing_notices or notice_number in new_notices:
+            continue
+
+        new_notices[notice_number] = {
+            "name": str(notice_number),
+            "notice_number": notice_number,
             "title": notice.get("title"),
             "registration_name": notice.get("registration_name"),
             "details_url": notice.get("detail_url"),
-            "registration_datetime": datetime.fromisoformat(
+            "registration_datetime": iso_to_db_datetime(
                 notice.get("registration_date")
-            ).strftime("%Y-%m-%d %H:%M:%S"),
+            ),
             "contents": notice.get("content"),
         }
-    )
-    doc.save()
 
-    try:
-        doc.submit()
-    except frappe.exceptions.DuplicateEntryError:
-        frappe.log_error(
-            title="Duplicate Entry Error",
-            message=f"Duplicate notice detected: {notice.get('notice_number')}",
-        )
-    except Exception as e:
-        frappe.log_error(
-            title="Notice Creation Failed",
-            message=f"Error creating notice {notice.get('notice_number')}: {str(e)}",
-        )
+    bulk_insert_records(
+        NOTICES_DOCTYPE_NAME, list(new_notices.values()), chunk_size=500
+    )
 
 
 def stock_mvt_search_on_success(response: dict, **kwargs) -> None:
     stock_list = response["data"]["stockList"]
 
+    stock_movements, stock_movement_items = [], []
     for stock in stock_list:
-        doc = frappe.new_doc(REGISTERED_STOCK_MOVEMENTS_DOCTYPE_NAME)
-
-        doc.customer_pin = stock["custTin"]
-        doc.customer_branch_id = stock["custBhfId"]
-        doc.stored_and_released_number = stock["sarNo"]
-        doc.occurred_date = stock["ocrnDt"]
-        doc.total_item_count = stock["totItemCnt"]
-        doc.total_supply_price = stock["totTaxblAmt"]
-        doc.total_vat = stock["totTaxAmt"]
-        doc.total_amount = stock["totAmt"]
-        doc.remark = stock["remark"]
-
-        doc.set("items", [])
-
-        for item in stock["itemList"]:
-            doc.append(
-                "items",
-                {
-                    "item_name": item["itemNm"],
-                    "item_sequence": item["itemSeq"],
-                    "item_code": item["itemCd"],
-                    "barcode": item["bcd"],
-                    "item_classification_code": item["itemClsCd"],
-                    "packaging_unit_code": item["pkgUnitCd"],
-                    "unit_of_quantity_code": item["qtyUnitCd"],
-                    "package": item["pkg"],
-                    "quantity": item["qty"],
-                    "item_expiry_date": item["itemExprDt"],
-                    "unit_price": item["prc"],
-                    "supply_amount": item["splyAmt"],
-                    "discount_rate": item["totDcAmt"],
-                    "taxable_amount": item["taxblAmt"],
-                    "tax_amount": item["taxAmt"],
-                    "taxation_type_code": item["taxTyCd"],
-                    "total_amount": item["totAmt"],
-                },
+        stock_movement_name = frappe.generate_hash(length=10)
+        stock_movements.append(
+            {
+                "name": stock_movement_name,
+                "customer_pin": stock["custTin"],
+                "customer_branch_id": stock["custBhfId"],
+                "stored_and_released_number": stock["sarNo"],
+                "occurred_date": stock["ocrnDt"],
+                "total_item_count": stock["totItemCnt"],
+                "total_supply_price": stock["totTaxblAmt"],
+                "total_vat": stock["totTaxAmt"],
+                "total_amount": stock["totAmt"],
+                "remark": stock["remark"],
+            }
+        )
+        stock_movement_items.extend(
+            dict(
+                zip(
+                    STOCK_MOVEMENT_ITEM_FIELD_MAP, get_stock_movement_item_values(item)
+                ),
+                parent=stock_movement_name,
+                parentfield="items",
+                parenttype=REGISTERED_STOCK_MOVEMENTS_DOCTYPE_NAME,
+                idx=idx,
             )
+            for idx, item in enumerate(stock["itemList"], start=1)
+        )
 
-        doc.save()
+    bulk_insert_records(
+        REGISTERED_STOCK_MOVEMENTS_DOCTYPE_NAME, stock_movements, chunk_size=500
+    )
+    bulk_insert_records(
+        REGISTERED_STOCK_MOVEMENTS_ITEM_DOCTYPE_NAME,
+        stock_movement_items,
+        chunk_size=500,
+    )
 
 
 def imported_items_search_on_success(response: dict, **kwargs) -> None:
     items = response.get("results", [])
-    batch_size = 20
-    counter = 0
 
+    import_statuses = get_link_value_map(
+        IMPORTED_ITEMS_STATUS_DOCTYPE_NAME,
+        "code",
+        (item.get("import_item_status_code") for item in items),
+    )
+    countries = get_link_value_map(
+        COUNTRIES_DOCTYPE_NAME,
+        "code",
+        [item.get("origin_nation_code") for item in items]
+        + [item.get("export_nation_code") for item in items],
+    )
+    packaging_units = get_or_create_code_link_map(
+        PACKAGING_UNIT_DOCTYPE_NAME,
+        (item.get("packaging_unit_code") for item in items),
+    )
+    units_of_quantity = get_or_create_code_link_map(
+        UNIT_OF_QUANTITY_DOCTYPE_NAME,
+        (item.get("quantity_unit_code") for item in items),
+    )
+
+    branches = get_link_value_map(
+        "Branch", "slade_id", (item.get("branch") for item in items)
+    )
+    products = get_link_value_map(
+        "Item", "custom_slade_id", (item.get("product") for item in items)
+    )
+
+    existing_items = {}
+    for record in frappe.get_all(
+        REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME,
+        filters={"slade_id": ["in", [item.get("id") for item in items]]},
+        fields=["name", "slade_id"],
+        order_by="creation desc",
+    ):
+        existing_items.setdefault(record.slade_id, record.name)
+
+    errors = []
+    new_items = {}
     for item in items:
-        try:
-            item_id = item.get("id")
-            existing_item = frappe.db.get_value(
-                REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME,
-                {"slade_id": item_id},
-                "name",
-                order_by="creation desc",
-            )
+        item_id = item.get("id")
+        if not item_id:
+            continue
 
+        try:
             request_data = {
                 "item_name": item.get("item_name"),
                 "product_name": item.get("product_name"),
@@ -774,29 +900,22 @@ def imported_items_search_on_success(response: dict, **kwargs) -> None:
                 "item_sequence": item.get("item_sequence"),
                 "declaration_number": item.get("declaration_number"),
                 "imported_item_status_code": item.get("import_item_status_code"),
-                "imported_item_status": get_link_value(
-                    IMPORTED_ITEMS_STATUS_DOCTYPE_NAME,
-                    "code",
-                    item.get("import_item_status_code"),
+                "imported_item_status": import_statuses.get(
+                    item.get("import_item_status_code")
                 ),
                 "hs_code": item.get("hs_code"),
-                "origin_nation_code": get_link_value(
-                    COUNTRIES_DOCTYPE_NAME, "code", item.get("origin_nation_code")
-                ),
-                "export_nation_code": get_link_value(
-                    COUNTRIES_DOCTYPE_NAME, "code", item.get("export_nation_code")
-                ),
+                "origin_nation_code": countries.get(item.get("origin_nation_code")),
+                "export_nation_code": countries.get(item.get("export_nation_code")),
                 "package": item.get("package"),
-                "packaging_unit_code": get_or_create_link(
-                    PACKAGING_UNIT_DOCTYPE_NAME, "code", item.get("packaging_unit_code")
+                "packaging_unit_code": packaging_units.get(
+                    item.get("packaging_unit_code")
                 ),
                 "quantity": item.get("quantity"),
-                "quantity_unit_code": get_or_create_link(
-                    UNIT_OF_QUANTITY_DOCTYPE_NAME,
-                    "code",
-                    item.get("quantity_unit_code"),
+                "quantity_unit_code": units_of_quantity.get(
+                    item.get("quantity_unit_code")
                 ),
-                "branch": get_or_create_link("Branch", "slade_id", item.get("branch")),
+                "branch": branches.get(item.get("branch"))
+                or get_or_create_link("Branch", "slade_id", item.get("branch")),
                 # "organisation": get_or_create_link(
                 #     ORGANISATION_UNIT_DOCTYPE_NAME, "slade_id", item.get("organisation")
                 # ),
@@ -814,51 +933,51 @@ def imported_items_search_on_success(response: dict, **kwargs) -> None:
                 "slade_id": item_id,
                 "sent_to_etims": 1 if item.get("sent_to_etims") else 0,
             }
-
-            if existing_item:
-                item_doc = frappe.get_doc(
-                    REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, existing_item
-                )
-                item_doc.update(request_data)
-                item_doc.flags.ignore_mandatory = True
-                item_doc.save(ignore_permissions=True)
-            else:
-                item_doc = frappe.get_doc(
-                    {"doctype": REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, **request_data}
-                )
-                item_doc.insert(
-                    ignore_permissions=True,
-                    ignore_mandatory=True,
-                    ignore_if_duplicate=True,
-                )
-
-            if item.get("product"):
-                product_name = get_link_value(
-                    "Item", "custom_slade_id", item.get("product")
-                )
-                product = frappe.get_doc("Item", product_name)
-                product.custom_referenced_imported_item = item_doc.name
-                product.custom_imported_item_task_code = item_doc.task_code
-                product.custom_hs_code = item_doc.hs_code
-                product.custom_branch = item_doc.branch
-                product.custom_organisation = item_doc.organisation
-                product.custom_imported_item_submitted = item_doc.sent_to_etims
-                product.custom_imported_item_status = item_doc.imported_item_status
-                product.custom_imported_item_status_code = (
-                    item_doc.imported_item_status_code
-                )
-                product.flags.ignore_mandatory = True
-                product.save()
-
-            counter += 1
-            if counter % batch_size == 0:
-                frappe.db.commit()
-
         except Exception as e:
+            # A malformed record is logged and skipped so the rest of the page is
+            # still saved
+            errors.append(f"Imported Item {item_id}: {e}")
             continue
 
-    if counter % batch_size != 0:
-        frappe.db.commit()
+        item_name = existing_items.get(item_id)
+        if item_name:
+            queue_pending_update(
+                REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, item_name, request_data
+            )
+        else:
+            item_name = item_id
+            new_items[item_id] = {"name": item_id, **request_data}
+
+        product_name = products.get(item.get("product"))
+        if product_name:
+            queue_pending_update(
+                "Item",
+                product_name,
+                {
+                    "custom_referenced_imported_item": item_name,
+                    "custom_imported_item_task_code": request_data["task_code"],
+                    "custom_hs_code": request_data["hs_code"],
+                    "custom_branch": request_data["branch"],
+                    "custom_imported_item_submitted": request_data["sent_to_etims"],
+                    "custom_imported_item_status": request_data["imported_item_status"],
+                    "custom_imported_item_status_code": request_data[
+                        "imported_item_status_code"
+                    ],
+                },
+            )
+
+    # Branches are searched in parallel jobs, which may return the same item
+    bulk_insert_records(
+        REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME,
+        list(new_items.values()),
+        chunk_size=500,
+        ignore_duplicates=True,
+    )
+    flush_pending_updates()
+    frappe.db.commit()
+
+    if errors:
+        frappe.log_error(title="Imported Item Sync Errors", message="\n".join(errors))
 
     frappe.msgprint(
         "Imported Items fetched successfully. Go to <b>Navari eTims Registered Imported Item</b> Doctype for more information."
@@ -891,105 +1010,160 @@ def parse_date(date_str: str) -> None:
 
 
 def search_branch_request_on_success(response: dict, **kwargs) -> None:
-    for branch in response.get("results", []):
-        doc = None
+    branches = response.get("results", [])
+    if not branches:
+        return
 
-        try:
-            doc = frappe.get_doc(
-                "Branch",
-                {"slade_id": branch["id"]},
-                for_update=True,
-            )
+    existing_by_slade_id, existing_by_name = {}, {}
+    for record in frappe.get_all(
+        "Branch",
+        or_filters={
+            "slade_id": ["in", [branch["id"] for branch in branches]],
+            "branch": ["in", [branch["name"] for branch in branches]],
+        },
+        fields=["name", "branch", "slade_id"],
+    ):
+        if record.slade_id:
+            existing_by_slade_id[record.slade_id] = record.name
+        existing_by_name[record.branch] = record.name
+
+    new_branches = {}
+    for branch in branches:
+        values = {
+            "branch": branch["name"],
+            "slade_id": branch["id"],
+            "custom_etims_device_serial_no": branch["etims_device_serial_no"],
+            "custom_branch_code": branch["etims_branch_id"],
+            "custom_pin": branch["organisation_tax_pin"],
+            "custom_branch_name": branch["name"],
+            "custom_branch_status_code": branch["branch_status"],
+            "custom_county_name": branch["county_name"],
+            "custom_sub_county_name": branch["sub_county_name"],
+            "custom_tax_locality_name": branch["tax_locality_name"],
+            "custom_location_description": branch["location_description"],
+            "custom_manager_name": branch["manager_name"],
+            "custom_manager_contact": branch["parent_phone_number"],
+            "custom_manager_email": branch["email_address"],
+            "custom_is_head_office": "Y" if branch["is_headquater"] else "N",
+            "custom_is_etims_branch": 1 if branch["is_etims_verified"] else 0,
+        }
 
-        except frappe.exceptions.DoesNotExistError:
-            doc = frappe.new_doc("Branch")
-
-        finally:
-            doc.branch = branch["name"]
-            doc.slade_id = branch["id"]
-            doc.custom_etims_device_serial_no = branch["etims_device_serial_no"]
-            doc.custom_branch_code = branch["etims_branch_id"]
-            doc.custom_pin = branch["organisation_tax_pin"]
-            doc.custom_branch_name = branch["name"]
-            doc.custom_branch_status_code = branch["branch_status"]
-            doc.custom_county_name = branch["county_name"]
-            doc.custom_sub_county_name = branch["sub_county_name"]
-            doc.custom_tax_locality_name = branch["tax_locality_name"]
-            doc.custom_location_description = branch["location_description"]
-            doc.custom_manager_name = branch["manager_name"]
-            doc.custom_manager_contact = branch["parent_phone_number"]
-            doc.custom_manager_email = branch["email_address"]
-            doc.custom_is_head_office = "Y" if branch["is_headquater"] else "N"
-            doc.custom_is_etims_branch = 1 if branch["is_etims_verified"] else 0
-
-            doc.save()
+        existing_branch = existing_by_slade_id.get(
+            branch["id"]
+        ) or existing_by_name.get(branch["name"])
+        if existing_branch:
+            queue_pending_update("Branch", existing_branch, values)
+        else:
+            new_branches[branch["name"]] = {"name": branch["name"], **values}
+
+    flush_pending_updates()
+    bulk_insert_records("Branch", list(new_branches.values()))
 
 
 def item_search_on_success(response: dict, **kwargs) -> None:
     items = response.get("results", []) or [response]
 
+    item_classifications = get_link_value_map(
+        ITEM_CLASSIFICATIONS_DOCTYPE_NAME,
+        "slade_id",
+        (item_data.get("scu_item_classification") for item_data in items),
+    )
+    countries = get_link_value_map(
+        COUNTRIES_DOCTYPE_NAME,
+        "code",
+        (
+            (item_data.get("country_of_origin") or "KE")[:2].upper()
+            for item_data in items
+        ),
+    )
+    packaging_units = get_link_value_map(
+        PACKAGING_UNIT_DOCTYPE_NAME,
+        "slade_id",
+        (item_data.get("packaging_unit") for item_data in items),
+    )
+    units_of_quantity = get_link_value_map(
+        UNIT_OF_QUANTITY_DOCTYPE_NAME,
+        "slade_id",
+        (item_data.get("quantity_unit") for item_data in items),
+    )
+    taxation_types = get_link_value_map(
+        TAXATION_TYPE_DOCTYPE_NAME,
+        "slade_id",
+        ((item_data.get("sale_taxes") or [None])[0] for item_data in items),
+    )
+
+    existing_items = {}
+    slade_ids = [item_data.get("id") for item_data in items if item_data.get("id")]
+    if slade_ids:
+        for record in frappe.get_all(
+            "Item",
+            filters={"custom_slade_id": ["in", slade_ids]},
+            fields=["name", "item_code", "custom_slade_id", "custom_taxation_type"],
+            order_by="creation desc",
+        ):
+            existing_items.setdefault(record.custom_slade_id, record)
+
+    errors = []
     for item_data in items:
+        slade_id = item_data.get("id")
+        if not slade_id or not item_data.get("name"):
+            errors.append(f"Item {slade_id or item_data} is missing its id or name")
+            continue
+
         try:
-            slade_id = item_data.get("id")
-            existing_item = frappe.db.get_value(
-                "Item", {"custom_slade_id": slade_id}, "name", order_by="creation desc"
-            )
-            country_of_origin_code = item_data.get("country_of_origin", "KE")[
+            existing_item = existing_items.get(slade_id)
+            country_of_origin_code = (item_data.get("country_of_origin") or "KE")[
                 :2
             ].upper()
-            country_of_origin = get_link_value(
-                COUNTRIES_DOCTYPE_NAME, "code", country_of_origin_code
+            sale_taxes = item_data.get("sale_taxes")
+            taxation_type = taxation_types.get(sale_taxes[0]) if sale_taxes else None
+            country_of_origin = countries.get(country_of_origin_code)
+            item_code = (
+                existing_item.item_code if existing_item else item_data.get("code")
             )
-            item_code = item_data.get("code")
-
-            if existing_item:
-                item_doc = frappe.get_doc("Item", existing_item)
-                item_code = item_doc.item_code
 
             request_data = {
                 "item_name": item_data.get("name"),
                 "item_code": item_code,
                 "custom_item_registered": 1 if item_data.get("sent_to_etims") else 0,
-                "custom_slade_id": item_data.get("id"),
+                "custom_slade_id": slade_id,
                 "custom_sent_to_slade": 1,
                 "description": item_data.get("description"),
                 "is_sales_item": item_data.get("can_be_sold", False),
                 "is_purchase_item": item_data.get("can_be_purchased", False),
-                "code": item_data.get("code"),
                 "custom_item_code_etims": item_data.get("scu_item_code"),
                 "custom_etims_country_of_origin_code": country_of_origin_code,
-                "valuation_rate": round(item_data.get("selling_price", 0.0), 2),
-                "last_purchase_rate": round(item_data.get("purchasing_price", 0.0), 2),
-                "custom_item_classification": get_link_value(
-                    ITEM_CLASSIFICATIONS_DOCTYPE_NAME,
-                    "slade_id",
-                    item_data.get("scu_item_classification"),
+                "valuation_rate": round(item_data.get("selling_price") or 0.0, 2),
+                "last_purchase_rate": round(
+                    item_data.get("purchasing_price") or 0.0, 2
+                ),
+                "custom_item_classification": item_classifications.get(
+                    item_data.get("scu_item_classification")
                 ),
                 "custom_etims_country_of_origin": country_of_origin,
-                "custom_packaging_unit": get_link_value(
-                    PACKAGING_UNIT_DOCTYPE_NAME,
-                    "slade_id",
-                    item_data.get("packaging_unit"),
+                "custom_packaging_unit": packaging_units.get(
+                    item_data.get("packaging_unit")
                 ),
-                "custom_unit_of_quantity": get_link_value(
-                    UNIT_OF_QUANTITY_DOCTYPE_NAME,
-                    "slade_id",
-                    item_data.get("quantity_unit"),
+                "custom_unit_of_quantity": units_of_quantity.get(
+                    item_data.get("quantity_unit")
                 ),
                 "custom_item_type": item_data.get("item_type"),
-                "custom_taxation_type": get_link_value(
-                    TAXATION_TYPE_DOCTYPE_NAME,
-                    "slade_id",
-                    item_data.get("sale_taxes")[0],
-                ),
+                "custom_taxation_type": taxation_type,
                 "custom_product_type": item_data.get("product_type"),
             }
 
-            if existing_item:
-                item_doc = frappe.get_doc("Item", existing_item)
+            if existing_item and (
+                existing_item.custom_taxation_type
+                != request_data["custom_taxation_type"]
+            ):
+                # A changed taxation type has to go through the Item controller
+                # so the validate hook can rebuild the item tax templates
+                item_doc = frappe.get_doc("Item", existing_item.name)
                 item_doc.update(request_data)
                 item_doc.flags.ignore_mandatory = True
                 item_doc.save(ignore_permissions=True)
+            elif existing_item:
+                queue_pending_update("Item", existing_item.name, request_data)
             else:
                 request_data["item_group"] = "All Item Groups"
                 new_item = frappe.get_doc({"doctype": "Item", **request_data})
@@ -1000,11 +1174,20 @@ def item_search_on_success(response: dict, **kwargs) -> None:
                     ignore_if_duplicate=True,
                 )
 
-        except Exception as e:
-            continue
+        except (
+            frappe.ValidationError,
+            frappe.DuplicateEntryError,
+            TypeError,
+            ValueError,
+        ) as e:
+            errors.append(f"Item {slade_id}: {e}")
 
+    flush_pending_updates()
     frappe.db.commit()
 
+    if errors:
+        frappe.log_error(title="Item Sync Errors", message="\n".join(errors))
+
 
 def initialize_device_submission_on_success(response: dict, **kwargs) -> None:
     pass
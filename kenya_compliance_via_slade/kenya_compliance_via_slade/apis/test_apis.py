@@ -0,0 +1,42 @@
+from frappe.tests.utils import FrappeTestCase
+
+from .apis import get_missing_purchase_items
+
+
+class TestPurchaseItems(FrappeTestCase):
+    """Test Cases"""
+
+    def test_same_name_lines_with_different_classifications(self) -> None:
+        items = [
+            {
+                "item_name": "Maize Flour",
+                "product_code": "MF-01",
+                "item_classification_code": "10101501",
+            },
+            {
+                "item_name": "Maize Flour",
+                "product_code": "MF-02",
+                "item_classification_code": "50221101",
+            },
+            {
+                "item_name": "Maize Flour",
+                "product_code": "MF-01",
+                "item_classification_code": "10101501",
+            },
+        ]
+
+        new_items = get_missing_purchase_items(items, set())
+
+        self.assertEqual(
+            [item["product_code"] for item in new_items], ["MF-01", "MF-02"]
+        )
+
+    def test_existing_items_are_not_created(self) -> None:
+        items = [
+            {"item_name": "Maize Flour", "item_classification_code": "10101501"},
+            {"item_name": "Wheat Flour", "item_classification_code": "10101501"},
+        ]
+
+        new_items = get_missing_purchase_items(items, {"Maize Flour"})
+
+        self.assertEqual([item["item_name"] for item in new_items], ["Wheat Flour"])
@@ -0,0 +1,152 @@
+from unittest.mock import MagicMock, patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from ..doctype.doctype_names_mapping import REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME
+from ..utils import bulk_insert_records
+from .remote_response_status_handlers import (
+    imported_items_search_on_success,
+    item_search_on_success,
+)
+
+
+def build_imported_item(item_id: str, declaration_date: str = "2024-01-15") -> dict:
+    return {
+        "id": item_id,
+        "item_name": f"Imported {item_id}",
+        "task_code": f"TASK-{item_id}",
+        "declaration_date": declaration_date,
+        "hs_code": "1001990000",
+        "quantity": 10,
+    }
+
+
+class TestRemoteResponseStatusHandlers(FrappeTestCase):
+    """Test Cases"""
+
+    def delete_after_test(self, doctype: str, filters: dict) -> None:
+        def delete() -> None:
+            frappe.db.delete(doctype, filters)
+            frappe.db.commit()
+
+        self.addCleanup(delete)
+
+    @patch.object(frappe, "msgprint")
+    @patch.object(frappe, "log_error")
+    def test_malformed_imported_item_is_skipped(
+        self, mock_log_error: MagicMock, mock_msgprint: MagicMock
+    ) -> None:
+        good_id = frappe.generate_hash(length=10)
+        bad_id = frappe.generate_hash(length=10)
+        self.delete_after_test(
+            REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME,
+            {"slade_id": ["in", [good_id, bad_id]]},
+        )
+
+        imported_items_search_on_success(
+            {
+                "results": [
+                    build_imported_item(bad_id, declaration_date="not a date"),
+                    build_imported_item(good_id),
+                ]
+            }
+        )
+
+        self.assertTrue(
+            frappe.db.exists(
+                REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, {"slade_id": good_id}
+            )
+        )
+        self.assertFalse(
+            frappe.db.exists(
+                REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, {"slade_id": bad_id}
+            )
+        )
+        mock_log_error.assert_called_once()
+        self.assertIn(bad_id, mock_log_error.call_args.kwargs["message"])
+
+    @patch.object(frappe, "msgprint")
+    def test_imported_item_inserted_by_another_branch(
+        self, mock_msgprint: MagicMock
+    ) -> None:
+        item_id = frappe.generate_hash(length=10)
+        self.delete_after_test(REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, {"name": item_id})
+        record = {"name": item_id, **build_imported_item(item_id)}
+        record.pop("id")
+        record["slade_id"] = item_id
+        record.pop("declaration_date")
+
+        # Another branch's job inserts the item after this page's existence check
+        with patch.object(frappe, "get_all", return_value=[]):
+            bulk_insert_records(REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, [record])
+            imported_items_search_on_success(
+                {"results": [build_imported_item(item_id)]}
+            )
+
+        self.assertEqual(
+            frappe.db.count(REGISTERED_IMPORTED_ITEM_DOCTYPE_NAME, {"name": item_id}),
+            1,
+        )
+
+    @patch.object(frappe, "log_error")
+    def test_item_with_null_prices(self, mock_log_error: MagicMock) -> None:
+        slade_id = frappe.generate_hash(length=10)
+        self.delete_after_test("Item", {"custom_slade_id": slade_id})
+
+        item_search_on_success(
+            {
+                "results": [
+                    {
+                        "id": slade_id,
+                        "name": f"Test Item {slade_id}",
+                        "code": f"TEST-{slade_id}",
+                        "selling_price": None,
+                        "purchasing_price": None,
+                    }
+                ]
+            }
+        )
+
+        item = frappe.db.get_value(
+            "Item",
+            {"custom_slade_id": slade_id},
+            ["valuation_rate", "last_purchase_rate"],
+            as_dict=True,
+        )
+        self.assertIsNotNone(item)
+        self.assertEqual(item.valuation_rate, 0)
+        self.assertEqual(item.last_purchase_rate, 0)
+        mock_log_error.assert_not_called()
+
+    @patch.object(frappe, "log_error")
+    def test_malformed_item_is_skipped(self, mock_log_error: MagicMock) -> None:
+        slade_id = frappe.generate_hash(length=10)
+        self.delete_after_test("Item", {"custom_slade_id": slade_id})
+
+        item_search_on_success(
+            {
+                "results": [
+                    {
+                        "id": f"{slade_id}-bad",
+                        "name": f"Test Item {slade_id}-bad",
+                        "code": f"TEST-{slade_id}-bad",
+                        "selling_price": "not a price",
+                    },
+                    {
+                        "id": slade_id,
+                        "name": f"Test Item {slade_id}",
+                        "code": f"TEST-{slade_id}",
+                        "selling_price": 100,
+                        "purchasing_price": 80,
+                    },
+                ]
+            }
+        )
+
+        self.assertTrue(frappe.db.exists("Item", {"custom_slade_id": slade_id}))
+        self.assertFalse(
+            frappe.db.exists("Item", {"custom_slade_id": f"{slade_id}-bad"})
+        )
+        mock_log_error.assert_called_once()
+        self.assertIn(f"{slade_id}-bad", mock_log_error.call_args.kwargs["message"])
@@ -15,15 +15,16 @@ from ..doctype.doctype_names_mapping import (
     UOM_CATEGORY_DOCTYPE_NAME,
     WORKSTATION_DOCTYPE_NAME,
 )
-from ..utils import get_link_value
+from ..utils import get_link_value, loads_json
 
 
 def refresh_notices() -> None:
-    from ..apis.apis import perform_notice_search
+    # The scheduled refresh skips the endpoint cache so it always fetches new notices
+    from .tasks import search_notices
 
     company = frappe.defaults.get_user_default("Company")
 
-    perform_notice_search(json.dumps({"company_name": company}))
+    search_notices({"company_name": company})
 
 
 def send_sales_invoices_information() -> None:
@@ -133,7 +134,7 @@ def update_documents(
 ) -> None:
     if isinstance(data, str):
         try:
-            data = json.loads(data)
+            data = loads_json(data)
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON string: {data}")
 
@@ -308,7 +309,7 @@ def update_countries(response: list, **kwargs) -> None:
 def update_organisations(response: dict, **kwargs) -> None:
     if isinstance(response, str):
         try:
-            response = json.loads(response)
+            response = loads_json(response)
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON string: {response}")
 
@@ -405,13 +406,16 @@ def update_branches(response: dict, **kwargs) -> None:
 def update_departments(response: dict, **kwargs) -> None:
     if isinstance(response, str):
         try:
-            response = json.loads(response)
+            response = loads_json(response)
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON string: {response}")
 
     doc_list = (
         response if isinstance(response, list) else response.get("results", [response])
     )
+    default_company = frappe.defaults.get_user_default("Company") or frappe.get_value(
+        "Company", {}, "name"
+    )
 
     for record in doc_list:
         if isinstance(record, str):
@@ -441,8 +445,7 @@ def update_departments(response: dict, **kwargs) -> None:
         if record.get("organisation"):
             doc.company = (
                 get_link_value("Company", "custom_slade_id", record.get("organisation"))
-                or frappe.defaults.get_user_default("Company")
-                or frappe.get_value("Company", {}, "name")
+                or default_company
             )
         if record.get("parent"):
             doc.custom_branch = get_link_value(
@@ -525,13 +528,16 @@ def handle_warehouse_search_on_success(
 ) -> None:
     if isinstance(response, str):
         try:
-            response = json.loads(response)
+            response = loads_json(response)
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON string: {response}")
 
     doc_list = (
         response if isinstance(response, list) else response.get("results", [response])
     )
+    default_company = frappe.defaults.get_user_default("Company") or frappe.get_value(
+        "Company", {}, "name"
+    )
 
     for record in doc_list:
         if isinstance(record, str):
@@ -551,8 +557,7 @@ def handle_warehouse_search_on_success(
         if record.get("organisation"):
             doc.company = (
                 get_link_value("Company", "custom_slade_id", record.get("organisation"))
-                or frappe.defaults.get_user_default("Company")
-                or frappe.get_value("Company", {}, "name")
+                or default_company
             )
         if is_location and record.get("branch"):
             doc.branch = get_link_value("Branch", "slade_id", record.get("branch"))
@@ -577,7 +582,7 @@ def handle_warehouse_search_on_success(
 def pricelist_search_on_success(response: dict, **kwargs) -> None:
     if isinstance(response, str):
         try:
-            response = json.loads(response)
+            response = loads_json(response)
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON string: {response}")
 
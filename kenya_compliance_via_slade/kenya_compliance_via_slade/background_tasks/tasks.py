@@ -1,6 +1,5 @@
 import frappe
 import frappe.defaults
-from frappe.model.document import Document
 
 from ..apis.api_builder import EndpointsBuilder
 from ..apis.apis import process_request
@@ -9,7 +8,11 @@ from ..doctype.doctype_names_mapping import (
     OPERATION_TYPE_DOCTYPE_NAME,
     UOM_CATEGORY_DOCTYPE_NAME,
 )
-from ..overrides.server.stock_ledger_entry import on_update
+from ..overrides.server.stock_ledger_entry import (
+    claim_ledger_submission,
+    save_ledger_details,
+)
+from ..utils import cached_endpoint, get_default_company
 from .task_response_handlers import (
     itemprice_search_on_success,
     location_search_on_success,
@@ -33,10 +36,22 @@ from .task_response_handlers import (
 
 endpoints_builder = EndpointsBuilder()
 
+STOCK_LEDGER_BATCH_SIZE = 500
+
+# Entries queued per scheduler run, so the job queue doesn't grow with the
+# backlog. The rest are picked up by later runs
+STOCK_LEDGER_ENTRIES_PER_RUN = 1000
+
 
 @frappe.whitelist()
-def perform_notice_search(request_data: str) -> str:
+@cached_endpoint()
+def perform_notice_search(request_data: str | dict) -> str:
     """Function to perform notice search."""
+    return search_notices(request_data)
+
+
+def search_notices(request_data: str | dict) -> str:
+    """Fetch notices straight from eTims, without going through the endpoint cache."""
     message = process_request(
         request_data, "NoticeSearchReq", notices_search_on_success
     )
@@ -46,6 +61,7 @@ def perform_notice_search(request_data: str) -> str:
 @frappe.whitelist()
 def refresh_code_lists(request_data: str) -> str:
     """Refresh code lists based on request data."""
+    request_data = frappe.parse_json(request_data)
     tasks = [
         ("CurrencyCountrySearchReq", update_countries),
         ("CurrencySearchReq", update_currencies),
@@ -55,9 +71,19 @@ def refresh_code_lists(request_data: str) -> str:
         ("PaymentMtdSearchReq", update_payment_methods),
     ]
 
-    messages = [process_request(request_data, task[0], task[1]) for task in tasks]
+    # The code lists don't depend on one another, so each is fetched in its own
+    # job and the lists download in parallel
+    for route_key, handler_function in tasks:
+        frappe.enqueue(
+            process_request,
+            queue="long",
+            job_name=f"{route_key}_refresh_code_list",
+            request_data=request_data,
+            route_key=route_key,
+            handler_function=handler_function,
+        )
 
-    return " ".join(messages)
+    return "Code list refresh queued."
 
 
 @frappe.whitelist()
@@ -70,6 +96,8 @@ def search_organisations_request(request_data: str) -> str:
         ("WorkstationSearchReq", update_workstations),
     ]
 
+    # Parsed once and shared by every request in the batch
+    request_data = frappe.parse_json(request_data)
     messages = [process_request(request_data, task[0], task[1]) for task in tasks]
 
     return " ".join(messages)
@@ -85,6 +113,7 @@ def get_item_classification_codes(request_data: str) -> str:
 
 
 @frappe.whitelist()
+@cached_endpoint()
 def fetch_etims_uom_categories(request_data: str) -> None:
     message = process_request(
         request_data,
@@ -96,6 +125,7 @@ def fetch_etims_uom_categories(request_data: str) -> None:
 
 
 @frappe.whitelist()
+@cached_endpoint()
 def fetch_etims_uom_list(request_data: str) -> None:
     message = process_request(
         request_data,
@@ -107,7 +137,26 @@ def fetch_etims_uom_list(request_data: str) -> None:
 
 
 @frappe.whitelist()
-def fetch_etims_warehouse_list(request_data: str) -> None:
+def fetch_etims_warehouse_list(request_data: str) -> str:
+    # Locations link to the warehouses they sit under, so the two lists can't be
+    # fetched side by side. Both are fetched in turn from one background job
+    # instead of holding up the web request
+    request_data = frappe.parse_json(request_data)
+    company_name = request_data.get("company_name") or get_default_company()
+    frappe.enqueue(
+        sync_etims_warehouses_and_locations,
+        queue="long",
+        job_name=f"{company_name}_warehouse_sync",
+        # Skip queuing again while a sync for this company is still pending
+        job_id=f"{company_name}_warehouse_sync",
+        deduplicate=True,
+        request_data=request_data,
+    )
+
+    return "Warehouse and location sync queued."
+
+
+def sync_etims_warehouses_and_locations(request_data: str | dict) -> tuple[str, str]:
     warehouses = process_request(
         request_data,
         "WarehousesSearchReq",
@@ -124,6 +173,7 @@ def fetch_etims_warehouse_list(request_data: str) -> None:
 
 
 @frappe.whitelist()
+@cached_endpoint()
 def fetch_etims_pricelists(request_data: str) -> None:
     pricelists = process_request(
         request_data,
@@ -135,6 +185,7 @@ def fetch_etims_pricelists(request_data: str) -> None:
 
 
 @frappe.whitelist()
+@cached_endpoint()
 def fetch_etims_item_prices(request_data: str) -> None:
     itemprices = process_request(
         request_data,
@@ -146,6 +197,7 @@ def fetch_etims_item_prices(request_data: str) -> None:
 
 
 @frappe.whitelist()
+@cached_endpoint()
 def fetch_etims_operation_types(request_data: str) -> None:
     operation_types = process_request(
         request_data,
@@ -157,20 +209,42 @@ def fetch_etims_operation_types(request_data: str) -> None:
 
 
 def send_stock_information() -> None:
-    all_stock_ledger_entries: list[Document] = frappe.get_all(
-        "Stock Ledger Entry",
-        {"docstatus": 1, "custom_submitted_successfully": 0},
-        ["name"],
-    )
-    for entry in all_stock_ledger_entries:
-        doc = frappe.get_doc(
-            "Stock Ledger Entry", entry.name, for_update=False
-        )  # Refetch to get the document representation of the record
-
-        try:
-            on_update(
-                doc, method=None
-            )  # Delegate to the on_update method for Stock Ledger Entry override
-
-        except TypeError:
-            continue
+    # Entries are read a batch at a time, so the backlog is never held in memory
+    # all at once however large it grows
+    last_name = ""
+    queued = 0
+    while queued < STOCK_LEDGER_ENTRIES_PER_RUN:
+        entries: list[str] = frappe.get_all(
+            "Stock Ledger Entry",
+            {
+                "docstatus": 1,
+                "custom_submitted_successfully": 0,
+                "name": [">", last_name],
+            },
+            pluck="name",
+            order_by="name asc",
+            page_length=STOCK_LEDGER_BATCH_SIZE,
+        )
+        if not entries:
+            break
+
+        # Each entry is sent from its own job so one slow response doesn't hold up
+        # the rest. Entries still being sent from an earlier run are skipped
+        for entry in entries:
+            if queued >= STOCK_LEDGER_ENTRIES_PER_RUN:
+                break
+
+            if not claim_ledger_submission(entry):
+                continue
+
+            frappe.enqueue(
+                save_ledger_details,
+                queue="long",
+                job_name=f"{entry}_send_stock_information",
+                job_id=f"{entry}_send_stock_information",
+                deduplicate=True,
+                name=entry,
+            )
+            queued += 1
+
+        last_name = entries[-1]
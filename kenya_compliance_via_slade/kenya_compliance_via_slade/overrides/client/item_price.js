@@ -45,7 +45,10 @@ frappe.ui.form.on(doctypeName, {
                 },
               },
               callback: (response) => {
-                frappe.msgprint("Request queued. Please check in later.");
+                kenya_compliance_via_slade.watch_sync_job(
+                  response.message,
+                  frm
+                );
               },
               error: (r) => {
                 // Error Handling is Defered to the Server
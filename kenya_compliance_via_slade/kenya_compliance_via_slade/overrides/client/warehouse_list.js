@@ -24,6 +24,24 @@ frappe.listview_settings[doctypeName] = {
       __("eTims Actions")
     );
 
+    listview.page.add_action_item(__("Bulk Submit Warehouses"), function () {
+      const docsList = listview.get_checked_items().map((doc) => doc.name);
+
+      frappe.call({
+        method:
+          "kenya_compliance_via_slade.kenya_compliance_via_slade.apis.apis.bulk_save_warehouse_details",
+        args: {
+          docs_list: docsList,
+        },
+        callback: (response) => {
+          frappe.msgprint("Bulk submission queued.");
+        },
+        error: (r) => {
+          // Error Handling is Defered to the Server
+        },
+      });
+    });
+
     // listview.page.add_inner_button(
     //   __("Submit all Warehouses to eTims"),
     //   function (listview) {
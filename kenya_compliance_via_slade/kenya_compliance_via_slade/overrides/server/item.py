@@ -55,16 +55,16 @@ def validate(doc: Document, method: str) -> None:
     # Check if the tax type field has changed
     is_tax_type_changed = doc.has_value_changed("custom_taxation_type")
     if doc.custom_taxation_type and is_tax_type_changed:
-        relevant_tax_templates = frappe.get_all(
-            "Item Tax Template",
-            ["*"],
-            {"custom_etims_taxation_type": doc.custom_taxation_type},
-        )
+        relevant_tax_templates = get_tax_templates(doc.custom_taxation_type)
 
         if relevant_tax_templates:
-            doc.set("taxes", [])
-            for template in relevant_tax_templates:
-                doc.append("taxes", {"item_tax_template": template.name})
+            doc.set(
+                "taxes",
+                [
+                    {"item_tax_template": template}
+                    for template in relevant_tax_templates
+                ],
+            )
 
     required_fields = [
         doc.custom_etims_country_of_origin_code,
@@ -108,6 +108,24 @@ def validate(doc: Document, method: str) -> None:
     doc.custom_item_code_etims = f"{new_prefix}{existing_suffix}"
 
 
+def get_tax_templates(taxation_type: str) -> list[str]:
+    """The Item Tax Templates for an eTIMS taxation type.
+
+    Cached per request, as bulk item creation validates many items of the same
+    few taxation types."""
+    if not hasattr(frappe.local, "slade_tax_templates"):
+        frappe.local.slade_tax_templates = {}
+
+    if taxation_type not in frappe.local.slade_tax_templates:
+        frappe.local.slade_tax_templates[taxation_type] = frappe.get_all(
+            "Item Tax Template",
+            {"custom_etims_taxation_type": taxation_type},
+            pluck="name",
+        )
+
+    return frappe.local.slade_tax_templates[taxation_type]
+
+
 @frappe.whitelist()
 def prevent_item_deletion(doc: dict) -> None:
     if doc.custom_item_registered == 1:  # Assuming 1 means registered, adjust as needed
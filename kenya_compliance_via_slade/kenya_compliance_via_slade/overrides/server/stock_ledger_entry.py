@@ -6,13 +6,36 @@ from frappe.model.document import Document
 from ...apis.api_builder import EndpointsBuilder
 from ...apis.apis import process_request
 from ...doctype.doctype_names_mapping import OPERATION_TYPE_DOCTYPE_NAME
-from ...utils import extract_document_series_number
+from ...utils import (
+    extract_document_series_number,
+    get_document_values,
+    get_master_slade_id,
+)
 
 endpoints_builder = EndpointsBuilder()
 
+# Seconds an entry's submission is treated as in flight. Its eTims requests run
+# as a chain of jobs, and the entry is only marked submitted when the last one
+# succeeds, so it isn't sent again before then
+LEDGER_SUBMISSION_TTL = 1800
+
 
 def on_update(doc: Document, method: str | None = None) -> None:
-    save_ledger_details(doc.name)
+    if claim_ledger_submission(doc.name):
+        save_ledger_details(doc.name)
+
+
+def claim_ledger_submission(name: str) -> bool:
+    """Marks a ledger entry's submission as in flight.
+
+    Args:
+        name (str): The Stock Ledger Entry name
+
+    Returns:
+        bool: False if the entry's submission was already in flight
+    """
+    key = frappe.cache().make_key(f"slade_ledger_submission:{name}")
+    return bool(frappe.cache().set(key, 1, ex=LEDGER_SUBMISSION_TTL, nx=True))
 
 
 @frappe.whitelist()
@@ -23,7 +46,12 @@ def save_ledger_details(name: str) -> None:
             return
 
         elif not doc.custom_slade_id:
-            record = frappe.get_doc(doc.voucher_type, doc.voucher_no)
+            # Only a few header fields of the voucher go into the payload
+            record = get_document_values(
+                doc.voucher_type,
+                doc.voucher_no,
+                ["name", "is_return", "custom_successfully_submitted"],
+            )
             payload = prepare_payload(doc, record)
             handle_operation_type(doc, payload)
 
@@ -52,7 +80,7 @@ def prepare_payload(doc: dict, record: dict) -> dict:
         "name": doc.name,
         "document_name": doc.name,
         "branch": frappe.get_value("Branch", branch_name, "slade_id"),
-        "organisation": frappe.get_value("Company", company_name, "custom_slade_id"),
+        "organisation": get_master_slade_id("Company", company_name),
         "source_organisation_unit": frappe.get_value(
             "Department", department_name, "custom_slade_id"
         ),
@@ -236,19 +264,25 @@ def stock_mvt_submission_on_success(
     response: dict, document_name: str, **kwargs
 ) -> None:
     id = response.get("id")
-    frappe.db.set_value("Stock Ledger Entry", document_name, {"custom_slade_id": id})
+    frappe.db.set_value(
+        "Stock Ledger Entry",
+        document_name,
+        {"custom_slade_id": id},
+        update_modified=False,
+    )
     doc = frappe.get_doc("Stock Ledger Entry", document_name)
-    record = frappe.get_doc(doc.voucher_type, doc.voucher_no)
-    item = frappe.get_doc("Item", doc.item_code)
+    record = get_document_values(
+        doc.voucher_type, doc.voucher_no, ["branch", "company", "department"]
+    )
     route_key = "StockIOLineReq"
     requset_data = {
         "document_name": document_name,
         "branch": frappe.get_value("Branch", record.branch, "slade_id"),
-        "organisation": frappe.get_value("Company", record.company, "custom_slade_id"),
+        "organisation": get_master_slade_id("Company", record.company),
         "source_organisation_unit": frappe.get_value(
             "Department", record.department, "custom_slade_id"
         ),
-        "product": item.custom_slade_id,
+        "product": frappe.db.get_value("Item", doc.item_code, "custom_slade_id"),
         "quantity": abs(doc.actual_qty),
         "quantity_confirmed": abs(doc.actual_qty),
         "new_price": (round(int(doc.valuation_rate), 2) if doc.valuation_rate else 0),
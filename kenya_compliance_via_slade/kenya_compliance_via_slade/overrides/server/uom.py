@@ -0,0 +1,9 @@
+import frappe
+from frappe.model.document import Document
+
+ALL_UOMS_SYNCED_CACHE_KEY = "slade_all_uoms_synced"
+
+
+def on_update(doc: Document, method: str | None = None) -> None:
+    """UOM on_update hook. A new or changed UOM may need to be sent to eTims"""
+    frappe.cache().delete_value(ALL_UOMS_SYNCED_CACHE_KEY)
@@ -1,11 +1,14 @@
 """Utility functions"""
 
+import json
 import re
 from base64 import b64encode
 from datetime import datetime, timedelta
 from decimal import ROUND_DOWN, Decimal
+from functools import lru_cache, wraps
+from hashlib import sha256
 from io import BytesIO
-from typing import Literal
+from typing import Callable, Iterable, Literal
 from urllib.parse import urlencode
 
 import aiohttp
@@ -13,7 +16,13 @@ import qrcode
 import requests
 from aiohttp import ClientTimeout
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import frappe
+from frappe.model import default_fields
 from frappe.model.document import Document
 
 from .doctype.doctype_names_mapping import (
@@ -25,6 +34,12 @@ from .doctype.doctype_names_mapping import (
 )
 from .logger import etims_logger
 
+URL_PLACEHOLDER_PATTERN = re.compile(r"\{(.*?)\}")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Ends the message process_request returns once every page was handled
+REQUEST_COMPLETED_SUFFIX = "completed successfully."
+
 
 def is_valid_kra_pin(pin: str) -> bool:
     """Checks if the string provided conforms to the pattern of a KRA PIN.
@@ -41,21 +56,28 @@ def is_valid_kra_pin(pin: str) -> bool:
     return bool(re.match(pattern, pin))
 
 
-async def make_get_request(url: str) -> dict[str, str] | str:
+async def make_get_request(
+    url: str, session: aiohttp.ClientSession | None = None
+) -> dict[str, str] | str:
     """Make an Asynchronous GET Request to specified URL
 
     Args:
         url (str): The URL
+        session (aiohttp.ClientSession | None, optional): An open session to send
+            the request through. A new one is created if not provided.
 
     Returns:
         dict: The Response
     """
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.content_type.startswith("text"):
-                return await response.text()
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await make_get_request(url, session)
 
-            return await response.json()
+    async with session.get(url) as response:
+        if response.content_type.startswith("text"):
+            return await response.text()
+
+        return await response.json()
 
 
 async def make_post_request(
@@ -81,6 +103,21 @@ async def make_post_request(
             return await response.json()
 
 
+def loads_json(data: bytes | str) -> dict | list | str | int | float | None:
+    """Deserialise a JSON document, using orjson when it is installed.
+
+    Args:
+        data (bytes | str): The raw JSON. Pass bytes where available to skip decoding
+
+    Returns:
+        dict | list | str | int | float | None: The deserialised value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 def build_datetime_from_string(
     date_string: str, format: str = "%Y-%m-%d %H:%M:%S"
 ) -> datetime:
@@ -138,7 +175,25 @@ def get_route_path(
     routes_table_doctype: str = ROUTES_TABLE_CHILD_DOCTYPE_NAME,
     parent_doctype: str = ROUTES_TABLE_DOCTYPE_NAME,
 ) -> tuple[str, str] | None:
+    """Looks up a route's path and last request date. Cached per request."""
+    if not hasattr(frappe.local, "slade_route_paths"):
+        frappe.local.slade_route_paths = {}
+
+    cache_key = (search_field, vendor, routes_table_doctype, parent_doctype)
+    if cache_key not in frappe.local.slade_route_paths:
+        frappe.local.slade_route_paths[cache_key] = query_route_path(
+            search_field, vendor, routes_table_doctype, parent_doctype
+        )
+
+    return frappe.local.slade_route_paths[cache_key]
 
+
+def query_route_path(
+    search_field: str,
+    vendor: str,
+    routes_table_doctype: str,
+    parent_doctype: str,
+) -> tuple[str, str] | None:
     query = f"""
     SELECT
         child.url_path,
@@ -229,18 +284,42 @@ def get_current_environment_state(
     return environment
 
 
+def get_active_settings(company_name: str, branch_id: str = "00") -> dict | None:
+    """The active settings for a company's branch, falling back to any active
+    settings for the company.
+
+    Cached per request, and dropped whenever a token is refreshed.
+
+    Args:
+        company_name (str): The name of the company.
+        branch_id (str, optional): The branch ID. Defaults to "00".
+
+    Returns:
+        dict | None: The server URL, token details, name and workstation
+    """
+    if not hasattr(frappe.local, "slade_settings_cache"):
+        frappe.local.slade_settings_cache = {}
+
+    cache_key = (company_name, branch_id)
+    if cache_key not in frappe.local.slade_settings_cache:
+        fields = ["server_url", "access_token", "token_expiry", "name", "workstation"]
+        frappe.local.slade_settings_cache[cache_key] = frappe.db.get_value(
+            SETTINGS_DOCTYPE_NAME,
+            {"bhfid": branch_id, "company": company_name, "is_active": 1},
+            fields,
+            as_dict=True,
+        ) or frappe.db.get_value(
+            SETTINGS_DOCTYPE_NAME,
+            {"company": company_name, "is_active": 1},
+            fields,
+            as_dict=True,
+        )
+
+    return frappe.local.slade_settings_cache[cache_key]
+
+
 def get_server_url(company_name: str, branch_id: str = "00") -> str | None:
-    settings = frappe.db.get_value(
-        SETTINGS_DOCTYPE_NAME,
-        {"bhfid": branch_id, "company": company_name, "is_active": 1},
-        ["server_url"],
-        as_dict=True,
-    ) or frappe.db.get_value(
-        SETTINGS_DOCTYPE_NAME,
-        {"company": company_name, "is_active": 1},
-        ["server_url"],
-        as_dict=True,
-    )
+    settings = get_active_settings(company_name, branch_id)
 
     if settings:
         server_url = settings.get("server_url")
@@ -262,17 +341,7 @@ def build_headers(company_name: str, branch_id: str = "00") -> dict[str, str] |
     Returns:
         dict[str, str] | None: The headers including the refreshed token or None if failed.
     """
-    settings = frappe.db.get_value(
-        SETTINGS_DOCTYPE_NAME,
-        {"bhfid": branch_id, "company": company_name, "is_active": 1},
-        ["access_token", "token_expiry", "name", "workstation"],
-        as_dict=True,
-    ) or frappe.db.get_value(
-        SETTINGS_DOCTYPE_NAME,
-        {"company": company_name, "is_active": 1},
-        ["access_token", "token_expiry", "name", "workstation"],
-        as_dict=True,
-    )
+    settings = get_active_settings(company_name, branch_id)
 
     if settings:
         access_token = settings.get("access_token")
@@ -369,12 +438,12 @@ def build_invoice_payload(
         ),
         "customer": frappe.get_value("Customer", invoice.customer, "slade_id"),
         "invoice_date": str(invoice.posting_date),
-        "currency": frappe.get_value("Currency", invoice.currency, "custom_slade_id"),
+        "currency": get_master_slade_id("Currency", invoice.currency),
         "source_organisation_unit": frappe.get_value(
             "Department", invoice.department, "custom_slade_id"
         ),
         "branch": frappe.get_value("Branch", invoice.branch, "slade_id"),
-        "organisation": frappe.get_value("Company", invoice.company, "custom_slade_id"),
+        "organisation": get_master_slade_id("Company", invoice.company),
         "sales_type": "cash",
     }
 
@@ -431,6 +500,9 @@ def update_last_request_date(
     doc.save()
     frappe.db.commit()
 
+    if hasattr(frappe.local, "slade_route_paths"):
+        frappe.local.slade_route_paths.clear()
+
 
 def get_curr_env_etims_settings(
     company_name: str, vendor: str, branch_id: str = "00"
@@ -457,6 +529,7 @@ def get_most_recent_sales_number(
     return
 
 
+@lru_cache(maxsize=512)
 def get_qr_code(data: str) -> str:
     """Generate QR Code data
 
@@ -479,12 +552,24 @@ def add_file_info(data: str) -> str:
     return f"data:image/png;base64, {data}"
 
 
+@lru_cache(maxsize=512)
 def get_qr_code_bytes(data: bytes | str, format: str = "PNG") -> bytes:
-    """Create a QR code and return the bytes."""
-    img = qrcode.make(data)
+    """Create a QR code and return the bytes.
+
+    The smallest QR version that fits the data is used, and results are cached
+    since the same receipt is encoded again whenever a submission is retried."""
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=4,
+        border=2,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
 
     buffered = BytesIO()
-    img.save(buffered, format=format)
+    img.save(buffered, format=format, optimize=False)
 
     return buffered.getvalue()
 
@@ -506,13 +591,19 @@ def split_user_email(email_string: str) -> str:
 
 def calculate_tax(doc: "Document") -> None:
     """Calculate tax for each item in the document based on item-level or document-level tax template."""
+    tax_rates: dict[str, float | None] = {}
+
     for item in doc.items:
         tax: float = 0
         tax_rate: float | None = None
 
         # Check if the item has its own Item Tax Template
         if item.item_tax_template:
-            tax_rate = get_item_tax_rate(item.item_tax_template)
+            if item.item_tax_template not in tax_rates:
+                tax_rates[item.item_tax_template] = get_item_tax_rate(
+                    item.item_tax_template
+                )
+            tax_rate = tax_rates[item.item_tax_template]
         else:
             continue
 
@@ -616,7 +707,6 @@ def authenticate_and_get_token(
         "client_id": client_id,
         "client_secret": client_secret,
     }
-    print(payload)
     encoded_payload = urlencode(payload)
 
     headers = {
@@ -673,21 +763,470 @@ def update_navari_settings_with_token(docname: str) -> str:
 
     settings_doc.save()
 
+    if hasattr(frappe.local, "slade_settings_cache"):
+        frappe.local.slade_settings_cache.clear()
+
     return settings_doc
 
 
+def get_default_company() -> str | None:
+    """The current user's default company, falling back to any company.
+
+    Resolved once per request."""
+    if not hasattr(frappe.local, "slade_default_company"):
+        frappe.local.slade_default_company = frappe.defaults.get_user_default(
+            "Company"
+        ) or frappe.get_value("Company", {}, "name")
+
+    return frappe.local.slade_default_company
+
+
+def get_default_branch() -> str | None:
+    """The current user's default branch. Resolved once per request."""
+    if not hasattr(frappe.local, "slade_default_branch"):
+        frappe.local.slade_default_branch = frappe.defaults.get_user_default(
+            "Branch"
+        ) or frappe.get_value("Branch", "name")
+
+    return frappe.local.slade_default_branch
+
+
+def resolve_code_slade_ids(
+    records: Iterable[tuple[str, str | None]],
+) -> dict[tuple[str, str | None], str | None]:
+    """Look up the slade_id of several code list records, e.g. an item's taxation
+    type, classification, packaging unit and unit of quantity.
+
+    Code maps loaded by load_code_maps are used where available, and the remaining
+    records are resolved together with a single resolve_slade_ids query.
+
+    Args:
+        records (Iterable[tuple[str, str | None]]): (doctype, name) pairs
+
+    Returns:
+        dict[tuple[str, str | None], str | None]: The slade_id of each record, None
+            where the record does not exist or the name was empty
+    """
+    code_maps = getattr(frappe.local, "slade_code_maps", {})
+    results, lookups = {}, {}
+    for doctype, name in records:
+        if doctype in code_maps:
+            results[(doctype, name)] = code_maps[doctype].get(name)
+        else:
+            lookups[(doctype, name)] = (doctype, "name", name, "slade_id")
+
+    resolved = resolve_slade_ids(lookups.values())
+    results.update((record, resolved[lookup]) for record, lookup in lookups.items())
+
+    return results
+
+
+def get_master_slade_id(doctype: str, name: str | None) -> str | None:
+    """The custom_slade_id of a record in a small master table such as Company or
+    Currency.
+
+    The whole table's name -> custom_slade_id mapping is loaded on first use
+    and kept for the rest of the request.
+
+    Args:
+        doctype (str): The master doctype, e.g. "Company" or "Currency"
+        name (str | None): The record name. Empty values are not looked up.
+
+    Returns:
+        str | None: The record's Slade id, if any
+    """
+    if not name:
+        return None
+
+    if not hasattr(frappe.local, "slade_master_maps"):
+        frappe.local.slade_master_maps = {}
+
+    if doctype not in frappe.local.slade_master_maps:
+        frappe.local.slade_master_maps[doctype] = dict(
+            frappe.get_all(doctype, fields=["name", "custom_slade_id"], as_list=True)
+        )
+
+    return frappe.local.slade_master_maps[doctype].get(name)
+
+
+def load_code_maps(doctypes: Iterable[str]) -> None:
+    """Preload the name -> slade_id mapping of whole code lists for the request.
+
+    Meant for bulk operations: once loaded, resolve_code_slade_ids answers
+    slade_id lookups for these doctypes from memory, at one query per doctype.
+
+    Args:
+        doctypes (Iterable[str]): The code list doctypes to load
+    """
+    if not hasattr(frappe.local, "slade_code_maps"):
+        frappe.local.slade_code_maps = {}
+
+    for doctype in doctypes:
+        frappe.local.slade_code_maps[doctype] = dict(
+            frappe.get_all(doctype, fields=["name", "slade_id"], as_list=True)
+        )
+
+
+def cached_endpoint(ttl: int = 300) -> Callable:
+    """Reuse a reference-data fetch's result for identical requests within ttl
+    seconds, skipping the remote call altogether.
+
+    Results are kept in the site's Redis cache, keyed by the function and its
+    request_data. Only completed fetches are cached, so a failed or skipped one
+    is retried on the next call.
+
+    Args:
+        ttl (int, optional): Seconds a result stays cached. Defaults to 300.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(request_data: str | dict, *args, **kwargs):
+            # Keyed on the parsed data, serialized with sorted keys, so the same
+            # request sent with different key order or spacing shares an entry
+            request_data = frappe.parse_json(request_data)
+            request_hash = sha256(
+                frappe.as_json(request_data).encode(), usedforsecurity=False
+            ).hexdigest()
+            key = f"slade_endpoint:{func.__module__}.{func.__qualname__}:{request_hash}"
+
+            cached = frappe.cache().get_value(key)
+            if cached is not None:
+                return cached
+
+            result = func(request_data, *args, **kwargs)
+            if isinstance(result, str) and result.endswith(REQUEST_COMPLETED_SUFFIX):
+                frappe.cache().set_value(key, result, expires_in_sec=ttl)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_document_values(doctype: str, name: str, fields: Iterable[str]) -> frappe._dict:
+    """Read a document's scalar fields without loading the full Document.
+
+    Fields the doctype doesn't have come back as None, as they would from
+    Document.get.
+
+    Args:
+        doctype (str): The doctype to read from
+        name (str): The document name
+        fields (Iterable[str]): The fields to read
+
+    Returns:
+        frappe._dict: The requested field values
+    """
+    fields = list(fields)
+    values = frappe.db.get_value(
+        doctype, name, get_existing_fields(doctype, fields), as_dict=True
+    )
+    if not values:
+        frappe.throw(
+            f"{doctype} {name} not found",
+            frappe.DoesNotExistError,
+        )
+
+    return frappe._dict({field: values.get(field) for field in fields})
+
+
+def get_documents_values(
+    doctype: str, names: Iterable[str], fields: Iterable[str]
+) -> list[frappe._dict]:
+    """Read the scalar fields of many documents with a single query.
+
+    The batch counterpart of get_document_values. Names that don't exist are
+    skipped.
+
+    Args:
+        doctype (str): The doctype to read from
+        names (Iterable[str]): The document names
+        fields (Iterable[str]): The fields to read
+
+    Returns:
+        list[frappe._dict]: The requested field values of each document found
+    """
+    fields = list(fields)
+    records = frappe.get_all(
+        doctype,
+        filters={"name": ["in", list(names)]},
+        fields=get_existing_fields(doctype, fields),
+    )
+
+    return [
+        frappe._dict({field: record.get(field) for field in fields})
+        for record in records
+    ]
+
+
+def get_existing_fields(doctype: str, fields: Iterable[str]) -> list[str]:
+    """Filter out the fields the doctype doesn't have, e.g. an uninstalled custom
+    field, so they can be queried safely."""
+    meta = frappe.get_meta(doctype)
+    return [
+        field for field in fields if field in default_fields or meta.has_field(field)
+    ]
+
+
+def get_link_value_cache() -> dict[tuple[str, str, str, str], str]:
+    """The request's cache of resolved link values.
+
+    The cache is dropped when the transaction commits or rolls back, so values
+    read from uncommitted or since-changed records are not served afterwards.
+    """
+    if not hasattr(frappe.local, "slade_link_values"):
+        frappe.local.slade_link_values = {}
+        frappe.db.after_commit.add(clear_link_value_cache)
+        frappe.db.after_rollback.add(clear_link_value_cache)
+
+    return frappe.local.slade_link_values
+
+
+def clear_link_value_cache() -> None:
+    """Drops the request's cache of resolved link values."""
+    if hasattr(frappe.local, "slade_link_values"):
+        del frappe.local.slade_link_values
+
+
 def get_link_value(
     doctype: str, field_name: str, value: str, return_field: str = "name"
-) -> str:
-    try:
-        return frappe.db.get_value(doctype, {field_name: value}, return_field)
-    except Exception as e:
-        frappe.log_error(
-            title=f"Error Fetching Link for {doctype}",
-            message=f"Error while fetching link for {doctype} with {field_name}={value}: {str(e)}",
-        )
+) -> str | None:
+    """Look up a single linked record's field by matching another field.
+
+    Found values are cached for the rest of the request, since the same
+    companies, branches and codes get resolved over and over while syncing.
+
+    Args:
+        doctype (str): The doctype to search
+        field_name (str): The field to match value against
+        value (str): The value to match. Empty values are not looked up.
+        return_field (str, optional): The field to return. Defaults to "name".
+
+    Returns:
+        str | None: The return_field value of the matching record, if any
+    """
+    if not value:
         return None
 
+    cache = get_link_value_cache()
+    cache_key = (doctype, field_name, value, return_field)
+    link_value = cache.get(cache_key)
+    if link_value is None:
+        link_value = frappe.db.get_value(doctype, {field_name: value}, return_field)
+        if link_value is not None:
+            cache[cache_key] = link_value
+
+    return link_value
+
+
+def resolve_slade_ids(
+    lookups: Iterable[tuple[str, str, str | None, str]],
+) -> dict[tuple[str, str, str | None, str], str | None]:
+    """Resolve several get_link_value lookups against different doctypes in a
+    single round trip.
+
+    Shares get_link_value's request cache, so already resolved lookups are not
+    queried again.
+
+    Args:
+        lookups (Iterable[tuple[str, str, str | None, str]]): (doctype, field_name,
+            value, return_field) lookups, as passed to get_link_value
+
+    Returns:
+        dict[tuple[str, str, str | None, str], str | None]: The resolved value for
+            each lookup, None where nothing matched or the value was empty
+    """
+    cache = get_link_value_cache()
+    results = {lookup: cache.get(lookup) for lookup in lookups}
+    pending = [
+        lookup for lookup, value in results.items() if value is None and lookup[2]
+    ]
+    if not pending:
+        return results
+
+    queries, params = [], []
+    for index, (doctype, field_name, value, return_field) in enumerate(pending):
+        queries.append(
+            f"(SELECT {index} AS lookup, `{return_field}` AS value "
+            f"FROM `tab{doctype}` WHERE `{field_name}` = %s LIMIT 1)"
+        )
+        params.append(value)
+
+    for index, value in frappe.db.sql(" UNION ALL ".join(queries), params):
+        lookup = pending[int(index)]
+        if value is not None:
+            results[lookup] = cache[lookup] = value
+
+    return results
+
+
+def get_link_value_map(
+    doctype: str, field_name: str, values: Iterable[str], return_field: str = "name"
+) -> dict[str, str]:
+    """Resolve many link values with a single query.
+
+    Shares get_link_value's request cache, so only values not yet resolved in
+    this request are queried.
+
+    Args:
+        doctype (str): The doctype to search
+        field_name (str): The field to match values against
+        values (Iterable[str]): The values to resolve. Empty values are ignored
+        return_field (str, optional): The field to return. Defaults to "name".
+
+    Returns:
+        dict[str, str]: Mapping of each matched value to its return_field value
+    """
+    values = {value for value in values if value}
+    if not values:
+        return {}
+
+    cache = get_link_value_cache()
+    link_map, pending = {}, []
+    for value in values:
+        link_value = cache.get((doctype, field_name, value, return_field))
+        if link_value is None:
+            pending.append(value)
+        else:
+            link_map[value] = link_value
+
+    if pending:
+        for record in frappe.get_all(
+            doctype,
+            filters={field_name: ["in", pending]},
+            fields=[field_name, return_field],
+        ):
+            link_map.setdefault(record[field_name], record[return_field])
+
+        for value in pending:
+            if link_map.get(value) is not None:
+                cache[(doctype, field_name, value, return_field)] = link_map[value]
+
+    return link_map
+
+
+def get_or_create_code_link_map(doctype: str, codes: Iterable[str]) -> dict[str, str]:
+    """Resolve code-named records (e.g. packaging units) to their names, creating
+    any that are missing in a single bulk insert.
+
+    Missing records get the code as their name, code_name and code_description,
+    matching what the doctypes' before_insert hooks would set.
+
+    Args:
+        doctype (str): A doctype named by its "code" field
+        codes (Iterable[str]): The codes to resolve. Empty values are ignored.
+
+    Returns:
+        dict[str, str]: Mapping of each code to its record name
+    """
+    codes = {code for code in codes if code}
+    link_map = get_link_value_map(doctype, "code", codes)
+
+    missing_records = [
+        {"name": code, "code": code, "code_name": code, "code_description": code}
+        for code in codes
+        if code not in link_map
+    ]
+    # Another job may create the same code between the lookup and the insert
+    bulk_insert_records(doctype, missing_records, ignore_duplicates=True)
+    link_map.update((record["code"], record["name"]) for record in missing_records)
+
+    return link_map
+
+
+def queue_pending_update(doctype: str, name: str, values: dict) -> None:
+    """Accumulate field updates for a record instead of writing them immediately.
+
+    Queued updates are written in batches by flush_pending_updates().
+
+    Args:
+        doctype (str): The doctype of the record
+        name (str): The record name
+        values (dict): Mapping of fieldname to new value
+    """
+    if not hasattr(frappe.local, "slade_pending_updates"):
+        frappe.local.slade_pending_updates = {}
+        # Updates queued in a transaction that is rolled back must not be written
+        # by a later flush
+        frappe.db.after_rollback.add(discard_pending_updates)
+
+    doc_updates = frappe.local.slade_pending_updates.setdefault(doctype, {})
+    doc_updates.setdefault(name, {}).update(values)
+
+
+def flush_pending_updates(chunk_size: int = 100) -> None:
+    """Write all queued updates, issuing one UPDATE per chunk of records per doctype.
+
+    Args:
+        chunk_size (int, optional): Records per UPDATE statement. Defaults to 100.
+    """
+    pending = getattr(frappe.local, "slade_pending_updates", None)
+    discard_pending_updates()
+    if not pending:
+        return
+
+    for doctype, doc_updates in pending.items():
+        frappe.db.bulk_update(
+            doctype, doc_updates, chunk_size=chunk_size, update_modified=False
+        )
+
+
+def discard_pending_updates() -> None:
+    """Drops any queued updates without writing them."""
+    if hasattr(frappe.local, "slade_pending_updates"):
+        del frappe.local.slade_pending_updates
+
+
+def bulk_insert_records(
+    doctype: str,
+    records: list[dict],
+    chunk_size: int = 1000,
+    ignore_duplicates: bool = False,
+) -> None:
+    """Insert records with multi-row INSERT statements, bypassing the ORM.
+
+    Document hooks and validations are not run, so this is only suitable for
+    plain records fetched from eTims. Records lacking a name are given a
+    random hash name.
+
+    Args:
+        doctype (str): The doctype to insert into
+        records (list[dict]): Field values for each record. All records must
+            share the same keys.
+        chunk_size (int, optional): Rows per INSERT statement. Defaults to 1000.
+        ignore_duplicates (bool, optional): Skip records whose name already
+            exists, e.g. when another job inserted them since the caller checked.
+            Defaults to False.
+    """
+    if not records:
+        return
+
+    timestamp = frappe.utils.now()
+    user = frappe.session.user
+    fields = [field for field in records[0] if field != "name"]
+
+    values = [
+        (
+            record.get("name") or frappe.generate_hash(length=10),
+            timestamp,
+            timestamp,
+            user,
+            user,
+            *(record.get(field) for field in fields),
+        )
+        for record in records
+    ]
+
+    frappe.db.bulk_insert(
+        doctype,
+        ["name", "creation", "modified", "owner", "modified_by", *fields],
+        values,
+        ignore_duplicates=ignore_duplicates,
+        chunk_size=chunk_size,
+    )
+
 
 def get_or_create_link(doctype: str, field_name: str, value: str) -> str:
     if not value:
@@ -717,9 +1256,24 @@ def get_or_create_link(doctype: str, field_name: str, value: str) -> str:
         return None
 
 
+def format_phone_number(phone_number: str | None) -> str | None:
+    """Formats a phone number to the +254XXXXXXXXX form expected by eTIMS.
+
+    Args:
+        phone_number (str | None): The phone number as captured
+
+    Returns:
+        str | None: The formatted number, or None if it is too short
+    """
+    phone_number = WHITESPACE_PATTERN.sub("", phone_number or "")
+
+    return "+254" + phone_number[-9:] if len(phone_number) >= 9 else None
+
+
 def process_dynamic_url(route_path: str, request_data: dict | str) -> str:
-    import json
-    import re
+    placeholders = URL_PLACEHOLDER_PATTERN.findall(route_path)
+    if not placeholders:
+        return route_path
 
     if isinstance(request_data, str):
         try:
@@ -727,7 +1281,6 @@ def process_dynamic_url(route_path: str, request_data: dict | str) -> str:
         except json.JSONDecodeError as e:
             raise ValueError("Invalid JSON string in request_data.") from e
 
-    placeholders = re.findall(r"\{(.*?)\}", route_path)
     for placeholder in placeholders:
         if placeholder in request_data:
             route_path = route_path.replace(
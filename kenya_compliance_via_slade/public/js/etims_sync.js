@@ -0,0 +1,45 @@
+// Copyright (c) 2025, Navari Ltd and contributors
+// For license information, please see license.txt
+
+frappe.provide("kenya_compliance_via_slade");
+
+// Follows a sync queued by one of the sync_* endpoints and reports its outcome
+kenya_compliance_via_slade.watch_sync_job = function (jobId, frm) {
+  const pollInterval = 3000;
+  const maxAttempts = 100;
+  let attempts = 0;
+
+  frappe.show_alert({ message: __("Request queued."), indicator: "blue" });
+
+  const poll = () => {
+    frappe.call({
+      method:
+        "kenya_compliance_via_slade.kenya_compliance_via_slade.apis.apis.poll_sync_status",
+      args: { job_id: jobId },
+      callback: (response) => {
+        const { status, message } = response.message;
+
+        if (status === "finished") {
+          frappe.show_alert({
+            message: message || __("Sync completed."),
+            indicator: "green",
+          });
+          if (frm) {
+            frm.reload_doc();
+          }
+        } else if (status === "failed") {
+          frappe.msgprint(
+            __("Sync failed. Please check the Error Log for details.")
+          );
+        } else if (status !== "not_found" && ++attempts < maxAttempts) {
+          setTimeout(poll, pollInterval);
+        }
+      },
+      error: (r) => {
+        // Error Handling is Defered to the Server
+      },
+    });
+  };
+
+  setTimeout(poll, pollInterval);
+};